@@ -1,4 +1,6 @@
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, List, Dict, Tuple, Optional
 
@@ -24,6 +26,340 @@ from app.plugins import _PluginBase
 from app.schemas import NotificationType
 from app.schemas.types import EventType
 
+
+# 编历 NotificationType 枚举，生成消息类型选项
+_MSG_TYPE_OPTIONS = [{"title": item.value, "value": item.name} for item in NotificationType]
+
+# CloudDrive2 响应文本中的 "字段: 数值" 键值对
+_KV_PATTERN = re.compile(r'(\w+): ([\d.]+)')
+
+# 容量单位
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# 插件远程命令（静态结构）
+_COMMANDS = [
+    {
+        "cmd": "/cd2_restart",
+        "event": EventType.PluginAction,
+        "desc": "CloudDrive2重启",
+        "category": "",
+        "data": {
+            "action": "cd2_restart"
+        }
+    },
+    {
+        "cmd": "/cd2_info",
+        "event": EventType.PluginAction,
+        "desc": "CloudDrive2系统信息",
+        "category": "",
+        "data": {
+            "action": "cd2_info"
+        }
+    },
+    {
+        "cmd": "/cd",
+        "event": EventType.PluginAction,
+        "desc": "云下载",
+        "category": "",
+        "data": {
+            "action": "cloud_download"
+        }
+    }
+]
+
+# 插件配置页面（静态结构，模块加载时构建一次）
+_FORM_SCHEMA = [
+    {
+        'component': 'VForm',
+        'content': [
+            {
+                'component': 'VRow',
+                'content': [
+                    {
+                        'component': 'VCol',
+                        'props': {
+                            'cols': 12,
+                            'md': 3
+                        },
+                        'content': [
+                            {
+                                'component': 'VSwitch',
+                                'props': {
+                                    'model': 'enabled',
+                                    'label': '启用插件',
+                                }
+                            }
+                        ]
+                    },
+                    {
+                        'component': 'VCol',
+                        'props': {
+                            'cols': 12,
+                            'md': 3
+                        },
+                        'content': [
+                            {
+                                'component': 'VSwitch',
+                                'props': {
+                                    'model': 'notify',
+                                    'label': '开启通知',
+                                }
+                            }
+                        ]
+                    },
+                    {
+                        'component': 'VCol',
+                        'props': {
+                            'cols': 12,
+                            'md': 3
+                        },
+                        'content': [
+                            {
+                                'component': 'VSwitch',
+                                'props': {
+                                    'model': 'cd2_restart',
+                                    'label': 'cd2重启一次',
+                                }
+                            }
+                        ]
+                    },
+                    {
+                        'component': 'VCol',
+                        'props': {
+                            'cols': 12,
+                            'md': 3
+                        },
+                        'content': [
+                            {
+                                'component': 'VSwitch',
+                                'props': {
+                                    'model': 'onlyonce',
+                                    'label': '立即运行一次',
+                                }
+                            }
+                        ]
+                    }
+                ]
+            },
+            {
+                'component': 'VRow',
+                'content': [
+                    {
+                        'component': 'VCol',
+                        'props': {
+                            'cols': 12,
+                        },
+                        'content': [
+                            {
+                                'component': 'VTextarea',
+                                'props': {
+                                    'model': 'cd2_confs',
+                                    'label': 'cd2配置',
+                                    'rows': 2,
+                                    'placeholder': 'cd2配置1#http://127.0.0.1:19798#admin#123456（一行一个配置）'
+                                }
+                            }
+                        ]
+                    }
+                ]
+            },
+            {
+                'component': 'VRow',
+                'content': [
+                    {
+                        'component': 'VCol',
+                        'props': {
+                            'cols': 12,
+                            'md': 4
+                        },
+                        'content': [
+                            {
+                                'component': 'VCronField',
+                                'props': {
+                                    'model': 'cron',
+                                    'label': '检测周期',
+                                    'placeholder': '5位cron表达式'
+                                }
+                            }
+                        ]
+                    },
+                    {
+                        'component': 'VCol',
+                        'props': {
+                            'cols': 12,
+                            'md': 4
+                        },
+                        'content': [
+                            {
+                                'component': 'VTextField',
+                                'props': {
+                                    'model': 'keyword',
+                                    'label': '检测关键字'
+                                }
+                            }
+                        ]
+                    },
+                    {
+                        'component': 'VCol',
+                        'props': {
+                            'cols': 12,
+                            'md': 4
+                        },
+                        'content': [
+                            {
+                                'component': 'VSelect',
+                                'props': {
+                                    'multiple': False,
+                                    'chips': True,
+                                    'model': 'msgtype',
+                                    'label': '消息类型',
+                                    'items': _MSG_TYPE_OPTIONS
+                                }
+                            }
+                        ]
+                    }
+                ]
+            },
+            {
+                'component': 'VRow',
+                'content': [
+                    {
+                        'component': 'VCol',
+                        'props': {
+                            'cols': 12,
+                            'md': 4
+                        },
+                        'content': [
+                            {
+                                'component': 'VTextField',
+                                'props': {
+                                    'model': 'black_dir',
+                                    'label': 'cd2黑名单目录',
+                                    'placeholder': 'cd2上添加的本地目录(多个目录用英文逗号分隔)'
+                                }
+                            }
+                        ]
+                    },
+                    {
+                        'component': 'VCol',
+                        'props': {
+                            'cols': 12,
+                            'md': 4
+                        },
+                        'content': [
+                            {
+                                'component': 'VTextField',
+                                'props': {
+                                    'model': 'cloud_path',
+                                    'label': '云下载路径'
+                                }
+                            }
+                        ]
+                    },
+                ]
+            },
+            {
+                'component': 'VRow',
+                'content': [
+                    {
+                        'component': 'VCol',
+                        'props': {
+                            'cols': 12,
+                        },
+                        'content': [
+                            {
+                                'component': 'VAlert',
+                                'props': {
+                                    'type': 'info',
+                                    'variant': 'tonal',
+                                    'text': '周期检测CloudDrive2上传任务，检测是否命中检测关键词，发送通知。'
+                                }
+                            }
+                        ]
+                    }
+                ]
+            },
+            {
+                'component': 'VRow',
+                'content': [
+                    {
+                        'component': 'VCol',
+                        'props': {
+                            'cols': 12,
+                        },
+                        'content': [
+                            {
+                                'component': 'VAlert',
+                                'props': {
+                                    'type': 'info',
+                                    'variant': 'tonal',
+                                    'text': '周期检测CloudDrive2云盘CK是否过期，发送通知（挂载的本地路径可添加黑名单）。'
+                                }
+                            }
+                        ]
+                    }
+                ]
+            },
+            {
+                'component': 'VRow',
+                'content': [
+                    {
+                        'component': 'VCol',
+                        'props': {
+                            'cols': 12,
+                        },
+                        'content': [
+                            {
+                                'component': 'VAlert',
+                                'props': {
+                                    'type': 'success',
+                                    'variant': 'tonal'
+                                },
+                                'content': [
+                                    {
+                                        'component': 'span',
+                                        'text': 'HomePage配置教程请参考：'
+                                    },
+                                    {
+                                        'component': 'a',
+                                        'props': {
+                                            'href': 'https://raw.githubusercontent.com/thsrite/MoviePilot-Plugins/main/docs/Cd2Assistant.md',
+                                            'target': '_blank'
+                                        },
+                                        'text': 'https://raw.githubusercontent.com/thsrite/MoviePilot-Plugins/main/docs/Cd2Assistant.md'
+                                    }
+                                ]
+                            }
+                        ]
+                    }
+                ]
+            },
+            {
+                'component': 'VRow',
+                'content': [
+                    {
+                        'component': 'VCol',
+                        'props': {
+                            'cols': 12,
+                        },
+                        'content': [
+                            {
+                                'component': 'VAlert',
+                                'props': {
+                                    'type': 'info',
+                                    'variant': 'tonal',
+                                    'text': '如安装完启用插件后，HomePage提示404，重启MoviePilot即可。'
+                                }
+                            }
+                        ]
+                    }
+                ]
+            }
+        ]
+    }
+]
+
+
 class Cd2Tool(_PluginBase):
     # 插件名称
     plugin_name = "Cd2助手"
@@ -51,28 +387,28 @@ class Cd2Tool(_PluginBase):
     _cron = None
     _notify = False
     _msgtype = None
+    _mtype = NotificationType.Manual
     _keyword = None
+    _keyword_match = None
     _black_dir = None
+    _black_dir_set = frozenset()
     _cloud_path = None
     _cd2_confs = None
     _cd2_clients = {}
     _clients = {}
     _cd2_url = {}
+    # CloudDrive2信息缓存 {cd2_name: (时间, 信息)}
+    _cd2_info_cache = {}
+    _cd2_info_ttl = 5
 
     _scheduler: Optional[BackgroundScheduler] = None
 
     def init_plugin(self, config: dict = None):
-        # 检查版本兼容性
-        try:
-            if hasattr(settings, 'VERSION_FLAG'):
-                version = settings.VERSION_FLAG  # V2
-                logger.info("检测到MoviePilot V2版本")
-            else:
-                version = "v1"
-                logger.info("检测到MoviePilot V1版本")
-        except Exception as e:
-            logger.warning(f"版本检测失败: {e}")
-            version = "unknown"
+        # 检查版本兼容性（V2 设置中带有 VERSION_FLAG）
+        if hasattr(settings, 'VERSION_FLAG'):
+            logger.info("检测到MoviePilot V2版本")
+        else:
+            logger.info("检测到MoviePilot V1版本")
         
         # 检查 clouddrive 依赖是否可用
         if not CLOUDDRIVE_AVAILABLE:
@@ -84,6 +420,7 @@ class Cd2Tool(_PluginBase):
         self._cd2_clients = {}
         self._clients = {}
         self._cd2_url = {}
+        self._cd2_info_cache = {}
         if config:
             self._enabled = config.get("enabled")
             self._notify = config.get("notify")
@@ -99,6 +436,22 @@ class Cd2Tool(_PluginBase):
             # 兼容旧版本配置
             self.__sync_old_config()
 
+        # 关键字及黑名单目录在加载配置时解析一次，纯文本关键字直接子串判断，含正则语法时才编译正则
+        self._keyword_match = None
+        keyword = self._keyword
+        if keyword:
+            if re.escape(keyword) == keyword:
+                self._keyword_match = lambda text: keyword in text
+            else:
+                try:
+                    self._keyword_match = re.compile(keyword).search
+                except re.error as err:
+                    logger.error(f"异常关键字正则配置错误：{err}")
+        self._black_dir_set = frozenset(d.strip() for d in (self._black_dir or "").split(",") if d.strip())
+        # 消息类型按名称查表，未配置或无效时使用手动处理通知
+        self._mtype = NotificationType.__members__.get(str(self._msgtype), NotificationType.Manual) \
+            if self._msgtype else NotificationType.Manual
+
         # 停止现有任务
         self.stop_service()
 
@@ -107,30 +460,32 @@ class Cd2Tool(_PluginBase):
                 logger.error("Cd2助手配置错误，请检查配置")
                 return
 
-            for cd2_conf in self._cd2_confs.split("\n"):
-                _cd2_client = CloudDriveClient(str(cd2_conf).split("#")[1], str(cd2_conf).split("#")[2],
-                                               str(cd2_conf).split("#")[3])
-                _cd2_name = str(cd2_conf).split("#")[0]
+            for cd2_conf in self._cd2_confs.splitlines():
+                cd2_conf = cd2_conf.strip()
+                if not cd2_conf:
+                    continue
+                # 名称#地址#用户名#密码，每行只解析一次
+                _cd2_name, _cd2_url, _username, _password = cd2_conf.split("#")[:4]
+                _cd2_client = CloudDriveClient(_cd2_url, _username, _password)
                 if not _cd2_client:
                     logger.error(f"Cd2助手连接失败，请检查配置：{_cd2_name}")
                     continue
-                _client = Client(str(cd2_conf).split("#")[1], str(cd2_conf).split("#")[2],
-                                 str(cd2_conf).split("#")[3])
+                _client = Client(_cd2_url, _username, _password)
                 if not _client:
                     logger.error("Cd2助手连接失败，请检查配置")
                     continue
                 self._cd2_clients[_cd2_name] = _cd2_client
                 self._clients[_cd2_name] = _client
-                self._cd2_url[_cd2_name] = str(cd2_conf).split("#")[1]
+                self._cd2_url[_cd2_name] = _cd2_url
 
-            # 周期运行
-            self._scheduler = BackgroundScheduler(timezone=settings.TZ)
+            # 周期运行，仅在确有任务时创建调度器
+            run_date = datetime.now(tz=pytz.timezone(settings.TZ)) + timedelta(seconds=3)
 
             if self._cron:
                 try:
-                    self._scheduler.add_job(func=self.check,
-                                            trigger=CronTrigger.from_crontab(self._cron),
-                                            name="Cd2助手定时任务")
+                    self.__get_scheduler().add_job(func=self.check,
+                                                   trigger=CronTrigger.from_crontab(self._cron),
+                                                   name="Cd2助手定时任务")
                 except Exception as err:
                     logger.error(f"定时任务配置错误：{err}")
                     # 推送实时消息
@@ -139,10 +494,9 @@ class Cd2Tool(_PluginBase):
             # 立即运行一次
             if self._onlyonce:
                 logger.info(f"Cd2助手定时任务，立即运行一次")
-                self._scheduler.add_job(self.check, 'date',
-                                        run_date=datetime.now(
-                                            tz=pytz.timezone(settings.TZ)) + timedelta(seconds=3),
-                                        name="Cd2助手定时任务")
+                self.__get_scheduler().add_job(self.check, 'date',
+                                               run_date=run_date,
+                                               name="Cd2助手定时任务")
                 # 关闭一次性开关
                 self._onlyonce = False
 
@@ -152,10 +506,9 @@ class Cd2Tool(_PluginBase):
             # 立即运行一次
             if self._cd2_restart:
                 logger.info(f"CloudDrive2重启任务，立即运行一次")
-                self._scheduler.add_job(self.restart_cd2(), 'date',
-                                        run_date=datetime.now(
-                                            tz=pytz.timezone(settings.TZ)) + timedelta(seconds=3),
-                                        name="CloudDrive2重启任务")
+                self.__get_scheduler().add_job(self.restart_cd2, 'date',
+                                               run_date=run_date,
+                                               name="CloudDrive2重启任务")
                 # 关闭一次性开关
                 self._cd2_restart = False
 
@@ -163,10 +516,18 @@ class Cd2Tool(_PluginBase):
                 self.__update_config()
 
             # 启动任务
-            if self._scheduler.get_jobs():
+            if self._scheduler and self._scheduler.get_jobs():
                 self._scheduler.print_jobs()
                 self._scheduler.start()
 
+    def __get_scheduler(self) -> BackgroundScheduler:
+        """
+        获取调度器，首次添加任务时创建
+        """
+        if not self._scheduler:
+            self._scheduler = BackgroundScheduler(timezone=settings.TZ)
+        return self._scheduler
+
     def __sync_old_config(self):
         """
         兼容旧版本配置
@@ -214,29 +575,46 @@ class Cd2Tool(_PluginBase):
             logger.error("CloudDrive2连接失败，请检查配置")
             return
 
-        for f in fs.listdir():
-            error_msg = None
-            if f and f not in self._black_dir.split(","):
-                try:
-                    cloud_file = fs.listdir(f)
-                    if not cloud_file or len(cloud_file) == 0:
-                        logger.warning(f"云盘 {f} 为空")
-                        error_msg = f"云盘 {f} cookie过期"
-                except Exception as err:
-                    logger.error(f"云盘 {f} cookie过期：{err}")
-                    if "429" in str(err):
-                        error_msg = f"云盘 {f} 访问频率过高，请稍后再试"
-                    else:
-                        error_msg = f"云盘 {f} cookie过期"
+        dir_items = [f for f in fs.listdir() if f and f not in self._black_dir_set]
+        if not dir_items:
+            return
+
+        # 各云盘的列目录请求相互独立，并发发出以重叠网络往返，结果按原顺序通知
+        with ThreadPoolExecutor(max_workers=min(len(dir_items), 16),
+                                thread_name_prefix="cd2tool-cookie") as executor:
+            error_msgs = list(executor.map(lambda f: self.__probe_cloud_dir(fs, f), dir_items))
+
+        # 发送通知
+        if self._notify:
+            for error_msg in error_msgs:
+                if error_msg:
+                    self.__send_notify(error_msg)
 
-            # 发送通知
-            if self._notify and error_msg:
-                self.__send_notify(error_msg)
+    @staticmethod
+    def __probe_cloud_dir(fs, f) -> Optional[str]:
+        """
+        列出云盘目录判断cookie是否有效，返回错误信息
+        """
+        try:
+            cloud_file = fs.listdir(f)
+            if not cloud_file or len(cloud_file) == 0:
+                logger.warning(f"云盘 {f} 为空")
+                return f"云盘 {f} cookie过期"
+        except Exception as err:
+            logger.error(f"云盘 {f} cookie过期：{err}")
+            if "429" in str(err):
+                return f"云盘 {f} 访问频率过高，请稍后再试"
+            return f"云盘 {f} cookie过期"
+        return None
 
     def __check_task(self, cd2_name, cd2_client):
         """
         检查上传任务
         """
+        # 未配置关键字时不会命中任何任务，无需请求任务列表
+        keyword_match = self._keyword_match
+        if not keyword_match:
+            return
         logger.info(f"开始检查 {cd2_name} 上传任务")
         # 获取上传任务列表
         upload_tasklist = cd2_client.upload_tasklist.list(page=0, page_size=10, filter="")
@@ -245,14 +623,23 @@ class Cd2Tool(_PluginBase):
             return
 
         for task in upload_tasklist:
-            if task.get("status") == "FatalError" and self._keyword and re.search(self._keyword,
-                                                                                  task.get("errorMessage")):
+            if task.get("status") == "FatalError" and keyword_match(task.get("errorMessage") or ""):
                 logger.info(f"发现异常上传任务：{task.get('errorMessage')}")
                 # 发送通知
                 if self._notify:
                     self.__send_notify(task.get("errorMessage"))
                     break
 
+    def __select_clients(self, args) -> List[Tuple[str, Client]]:
+        """
+        按命令参数选择CloudDrive2客户端，未指定时返回全部，指定名称时直接按名称查找
+        """
+        if not args:
+            return list(self._clients.items())
+        cd2_name = str(args).lower()
+        client = self._clients.get(cd2_name)
+        return [(cd2_name, client)] if client else []
+
     @eventmanager.register(EventType.PluginAction)
     def restart_cd2(self, event: Event = None):
         """
@@ -263,19 +650,15 @@ class Cd2Tool(_PluginBase):
             if not event_data or event_data.get("action") != "cd2_restart":
                 return
             args = event_data.get("arg_str")
-            found = False
-            for cd2_name, client in self._clients.items():
-                if args and str(args).lower() != str(cd2_name):
-                    continue
-                found = True
-                self.post_message(channel=event.event_data.get("channel"),
-                                  title=f"{cd2_name} CloudDrive2重启成功！", userid=event.event_data.get("user"))
-                client.RestartService()
-
-            if args and not found:
+            targets = self.__select_clients(args)
+            if args and not targets:
                 self.post_message(channel=event.event_data.get("channel"),
                                   title=f"未找到 {args} 配置！", userid=event.event_data.get("user"))
                 return
+            for cd2_name, client in targets:
+                self.post_message(channel=event.event_data.get("channel"),
+                                  title=f"{cd2_name} CloudDrive2重启成功！", userid=event.event_data.get("user"))
+                client.RestartService()
         else:
             for cd2_name in self._clients.keys():
                 _client = self._clients.get(cd2_name)
@@ -294,7 +677,7 @@ class Cd2Tool(_PluginBase):
         _space_info = "\n"
         for f in fs.listdir():
             try:
-                if f and f not in self._black_dir.split(","):
+                if f and f not in self._black_dir_set:
                     space_info = cd2_client.GetSpaceInfo(CloudDrive_pb2.FileRequest(path=f))
                     space_info = self.__str_to_dict(space_info)
                     total = self.__convert_bytes(space_info.get("totalSpace"))
@@ -372,18 +755,14 @@ class Cd2Tool(_PluginBase):
                 return
 
             args = event_data.get("arg_str")
-            found = False
-            for cd2_name, client in self._clients.items():
-                if args and str(args).lower() != str(cd2_name):
-                    continue
-                found = True
-                cd2_client = self._cd2_clients[cd2_name]
-                self.__get_cd2_info(event=event, client=client, cd2_client=cd2_client)
-
-            if args and not found:
+            targets = self.__select_clients(args)
+            if args and not targets:
                 self.post_message(channel=event.event_data.get("channel"),
                                   title=f"未找到 {args} 配置！", userid=event.event_data.get("user"))
                 return
+            for cd2_name, client in targets:
+                cd2_client = self._cd2_clients[cd2_name]
+                self.__get_cd2_info(event=event, client=client, cd2_client=cd2_client)
 
     def __get_cd2_info(self, event: Event = None, client: Client = None, cd2_client: CloudDriveClient = None):
         """
@@ -406,25 +785,27 @@ class Cd2Tool(_PluginBase):
         # 云盘空间
         cloud_space = self.__get_cloud_space(cd2_client)
 
+        # 每个字段只取值一次
+        cpu_usage = system_info.get('cpuUsage')
+        mem_usage = system_info.get('memUsageKB')
+        uptime = system_info.get('uptime')
+        fh_table_count = system_info.get('fhTableCount')
+        dir_cache_count = system_info.get('dirCacheCount')
+        temp_file_count = system_info.get('tempFileCount')
+        download_speed = downloadFileList.get('globalBytesPerSecond')
+        upload_speed = uploadFileList.get('globalBytesPerSecond')
+
         system_info_dict = {
-            "cpuUsage": f"{system_info.get('cpuUsage'):.2f}%" if system_info.get(
-                "cpuUsage") else "0.00%" if system_info else None,
-            "memUsageKB": f"{system_info.get('memUsageKB') / 1024:.2f}MB" if system_info.get(
-                "memUsageKB") else "0MB" if system_info else None,
-            "uptime": self.convert_seconds(system_info.get('uptime')) if system_info.get(
-                "uptime") else "0秒" if system_info else None,
-            "fhTableCount": system_info.get('fhTableCount') if system_info.get(
-                "fhTableCount") else 0 if system_info else None,
-            "dirCacheCount": int(system_info.get('dirCacheCount')) if system_info.get(
-                "dirCacheCount") else 0 if system_info else None,
-            "tempFileCount": system_info.get('tempFileCount') if system_info.get(
-                "tempFileCount") else 0 if system_info else None,
-            "upload_count": task_count.get("uploadCount") if task_count.get("uploadCount") else 0,
-            "download_count": task_count.get("downloadCount") if task_count.get("downloadCount") else 0,
-            "download_speed": f"{downloadFileList.get('globalBytesPerSecond') / 1024 / 1024:.2f}MB/s" if downloadFileList.get(
-                "globalBytesPerSecond") else "0KB/s" if downloadFileList else "0KB/s",
-            "upload_speed": f"{uploadFileList.get('globalBytesPerSecond') / 1024 / 1024:.2f}MB/s" if uploadFileList.get(
-                "globalBytesPerSecond") else "0KB/s" if uploadFileList else "0KB/s",
+            "cpuUsage": f"{cpu_usage:.2f}%" if cpu_usage else "0.00%" if system_info else None,
+            "memUsageKB": f"{mem_usage / 1024:.2f}MB" if mem_usage else "0MB" if system_info else None,
+            "uptime": self.convert_seconds(uptime) if uptime else "0秒" if system_info else None,
+            "fhTableCount": fh_table_count if fh_table_count else 0 if system_info else None,
+            "dirCacheCount": int(dir_cache_count) if dir_cache_count else 0 if system_info else None,
+            "tempFileCount": temp_file_count if temp_file_count else 0 if system_info else None,
+            "upload_count": task_count.get("uploadCount") or 0,
+            "download_count": task_count.get("downloadCount") or 0,
+            "download_speed": f"{download_speed / 1024 / 1024:.2f}MB/s" if download_speed else "0KB/s",
+            "upload_speed": f"{upload_speed / 1024 / 1024:.2f}MB/s" if upload_speed else "0KB/s",
             "cloud_space": cloud_space
         }
 
@@ -462,29 +843,36 @@ class Cd2Tool(_PluginBase):
                 continue
             cd2_client = self._cd2_clients[cd2_name]
             if client and cd2_client:
-                break
+                return self.__get_cd2_info_cached(cd2_name, client, cd2_client)
 
         return self.__get_cd2_info(client=client, cd2_client=cd2_client)
 
+    def __get_cd2_info_cached(self, cd2_name, client: Client, cd2_client: CloudDriveClient):
+        """
+        获取CloudDrive2信息，仪表板、详情页、HomePage短时间内的重复刷新复用上次结果
+        """
+        now = time.monotonic()
+        cached = self._cd2_info_cache.get(cd2_name)
+        if cached and now - cached[0] < self._cd2_info_ttl:
+            return cached[1]
+        cd2_info = self.__get_cd2_info(client=client, cd2_client=cd2_client)
+        self._cd2_info_cache[cd2_name] = (now, cd2_info)
+        return cd2_info
+
     @staticmethod
     def __convert_bytes(size_in_bytes):
         """ Convert bytes to the most appropriate unit (PB, TB, GB, etc.) """
-        units = ['B', 'KB', 'MB', 'GB', 'TB', 'PB']
-        unit_index = 0
-
-        while size_in_bytes >= 1024 and unit_index < len(units) - 1:
-            size_in_bytes /= 1024
-            unit_index += 1
-
-        return f"{size_in_bytes:.2f} {units[unit_index]}"
+        # 由二进制位数直接得到单位，每级1024即10位
+        unit_index = min((int(size_in_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1) \
+            if size_in_bytes >= 1024 else 0
+        return f"{size_in_bytes / (1 << (10 * unit_index)):.2f} {_SIZE_UNITS[unit_index]}"
 
     @staticmethod
     def __str_to_dict(str_data):
         """
         字符串转字典
         """
-        pattern = re.compile(r'(\w+): ([\d.]+)')
-        matches = pattern.findall(str(str_data))
+        matches = _KV_PATTERN.findall(str(str_data))
         # 将匹配到的结果转换为字典
         return {key: float(value) for key, value in matches}
 
@@ -492,11 +880,8 @@ class Cd2Tool(_PluginBase):
         """
         发送通知
         """
-        mtype = NotificationType.Manual
-        if self._msgtype:
-            mtype = NotificationType.__getitem__(str(self._msgtype)) or NotificationType.Manual
         self.post_message(title="Cd2助手通知",
-                          mtype=mtype,
+                          mtype=self._mtype,
                           text=msg)
 
     @staticmethod
@@ -521,35 +906,7 @@ class Cd2Tool(_PluginBase):
 
     @staticmethod
     def get_command() -> List[Dict[str, Any]]:
-        return [
-            {
-                "cmd": "/cd2_restart",
-                "event": EventType.PluginAction,
-                "desc": "CloudDrive2重启",
-                "category": "",
-                "data": {
-                    "action": "cd2_restart"
-                }
-            },
-            {
-                "cmd": "/cd2_info",
-                "event": EventType.PluginAction,
-                "desc": "CloudDrive2系统信息",
-                "category": "",
-                "data": {
-                    "action": "cd2_info"
-                }
-            },
-            {
-                "cmd": "/cd",
-                "event": EventType.PluginAction,
-                "desc": "云下载",
-                "category": "",
-                "data": {
-                    "action": "cloud_download"
-                }
-            }
-        ]
+        return _COMMANDS
 
     def get_api(self) -> List[Dict[str, Any]]:
         return [{
@@ -564,303 +921,7 @@ class Cd2Tool(_PluginBase):
         """
         拼装插件配置页面，需要返回两块数据：1、页面配置；2、数据结构
         """
-        # 编历 NotificationType 枚举，生成消息类型选项
-        MsgTypeOptions = []
-        for item in NotificationType:
-            MsgTypeOptions.append({
-                "title": item.value,
-                "value": item.name
-            })
-        return [
-            {
-                'component': 'VForm',
-                'content': [
-                    {
-                        'component': 'VRow',
-                        'content': [
-                            {
-                                'component': 'VCol',
-                                'props': {
-                                    'cols': 12,
-                                    'md': 3
-                                },
-                                'content': [
-                                    {
-                                        'component': 'VSwitch',
-                                        'props': {
-                                            'model': 'enabled',
-                                            'label': '启用插件',
-                                        }
-                                    }
-                                ]
-                            },
-                            {
-                                'component': 'VCol',
-                                'props': {
-                                    'cols': 12,
-                                    'md': 3
-                                },
-                                'content': [
-                                    {
-                                        'component': 'VSwitch',
-                                        'props': {
-                                            'model': 'notify',
-                                            'label': '开启通知',
-                                        }
-                                    }
-                                ]
-                            },
-                            {
-                                'component': 'VCol',
-                                'props': {
-                                    'cols': 12,
-                                    'md': 3
-                                },
-                                'content': [
-                                    {
-                                        'component': 'VSwitch',
-                                        'props': {
-                                            'model': 'cd2_restart',
-                                            'label': 'cd2重启一次',
-                                        }
-                                    }
-                                ]
-                            },
-                            {
-                                'component': 'VCol',
-                                'props': {
-                                    'cols': 12,
-                                    'md': 3
-                                },
-                                'content': [
-                                    {
-                                        'component': 'VSwitch',
-                                        'props': {
-                                            'model': 'onlyonce',
-                                            'label': '立即运行一次',
-                                        }
-                                    }
-                                ]
-                            }
-                        ]
-                    },
-                    {
-                        'component': 'VRow',
-                        'content': [
-                            {
-                                'component': 'VCol',
-                                'props': {
-                                    'cols': 12,
-                                },
-                                'content': [
-                                    {
-                                        'component': 'VTextarea',
-                                        'props': {
-                                            'model': 'cd2_confs',
-                                            'label': 'cd2配置',
-                                            'rows': 2,
-                                            'placeholder': 'cd2配置1#http://127.0.0.1:19798#admin#123456（一行一个配置）'
-                                        }
-                                    }
-                                ]
-                            }
-                        ]
-                    },
-                    {
-                        'component': 'VRow',
-                        'content': [
-                            {
-                                'component': 'VCol',
-                                'props': {
-                                    'cols': 12,
-                                    'md': 4
-                                },
-                                'content': [
-                                    {
-                                        'component': 'VCronField',
-                                        'props': {
-                                            'model': 'cron',
-                                            'label': '检测周期',
-                                            'placeholder': '5位cron表达式'
-                                        }
-                                    }
-                                ]
-                            },
-                            {
-                                'component': 'VCol',
-                                'props': {
-                                    'cols': 12,
-                                    'md': 4
-                                },
-                                'content': [
-                                    {
-                                        'component': 'VTextField',
-                                        'props': {
-                                            'model': 'keyword',
-                                            'label': '检测关键字'
-                                        }
-                                    }
-                                ]
-                            },
-                            {
-                                'component': 'VCol',
-                                'props': {
-                                    'cols': 12,
-                                    'md': 4
-                                },
-                                'content': [
-                                    {
-                                        'component': 'VSelect',
-                                        'props': {
-                                            'multiple': False,
-                                            'chips': True,
-                                            'model': 'msgtype',
-                                            'label': '消息类型',
-                                            'items': MsgTypeOptions
-                                        }
-                                    }
-                                ]
-                            }
-                        ]
-                    },
-                    {
-                        'component': 'VRow',
-                        'content': [
-                            {
-                                'component': 'VCol',
-                                'props': {
-                                    'cols': 12,
-                                    'md': 4
-                                },
-                                'content': [
-                                    {
-                                        'component': 'VTextField',
-                                        'props': {
-                                            'model': 'black_dir',
-                                            'label': 'cd2黑名单目录',
-                                            'placeholder': 'cd2上添加的本地目录(多个目录用英文逗号分隔)'
-                                        }
-                                    }
-                                ]
-                            },
-                            {
-                                'component': 'VCol',
-                                'props': {
-                                    'cols': 12,
-                                    'md': 4
-                                },
-                                'content': [
-                                    {
-                                        'component': 'VTextField',
-                                        'props': {
-                                            'model': 'cloud_path',
-                                            'label': '云下载路径'
-                                        }
-                                    }
-                                ]
-                            },
-                        ]
-                    },
-                    {
-                        'component': 'VRow',
-                        'content': [
-                            {
-                                'component': 'VCol',
-                                'props': {
-                                    'cols': 12,
-                                },
-                                'content': [
-                                    {
-                                        'component': 'VAlert',
-                                        'props': {
-                                            'type': 'info',
-                                            'variant': 'tonal',
-                                            'text': '周期检测CloudDrive2上传任务，检测是否命中检测关键词，发送通知。'
-                                        }
-                                    }
-                                ]
-                            }
-                        ]
-                    },
-                    {
-                        'component': 'VRow',
-                        'content': [
-                            {
-                                'component': 'VCol',
-                                'props': {
-                                    'cols': 12,
-                                },
-                                'content': [
-                                    {
-                                        'component': 'VAlert',
-                                        'props': {
-                                            'type': 'info',
-                                            'variant': 'tonal',
-                                            'text': '周期检测CloudDrive2云盘CK是否过期，发送通知（挂载的本地路径可添加黑名单）。'
-                                        }
-                                    }
-                                ]
-                            }
-                        ]
-                    },
-                    {
-                        'component': 'VRow',
-                        'content': [
-                            {
-                                'component': 'VCol',
-                                'props': {
-                                    'cols': 12,
-                                },
-                                'content': [
-                                    {
-                                        'component': 'VAlert',
-                                        'props': {
-                                            'type': 'success',
-                                            'variant': 'tonal'
-                                        },
-                                        'content': [
-                                            {
-                                                'component': 'span',
-                                                'text': 'HomePage配置教程请参考：'
-                                            },
-                                            {
-                                                'component': 'a',
-                                                'props': {
-                                                    'href': 'https://raw.githubusercontent.com/thsrite/MoviePilot-Plugins/main/docs/Cd2Assistant.md',
-                                                    'target': '_blank'
-                                                },
-                                                'text': 'https://raw.githubusercontent.com/thsrite/MoviePilot-Plugins/main/docs/Cd2Assistant.md'
-                                            }
-                                        ]
-                                    }
-                                ]
-                            }
-                        ]
-                    },
-                    {
-                        'component': 'VRow',
-                        'content': [
-                            {
-                                'component': 'VCol',
-                                'props': {
-                                    'cols': 12,
-                                },
-                                'content': [
-                                    {
-                                        'component': 'VAlert',
-                                        'props': {
-                                            'type': 'info',
-                                            'variant': 'tonal',
-                                            'text': '如安装完启用插件后，HomePage提示404，重启MoviePilot即可。'
-                                        }
-                                    }
-                                ]
-                            }
-                        ]
-                    }
-                ]
-            }
-        ], {
+        return _FORM_SCHEMA, {
             "enabled": False,
             "notify": False,
             "onlyonce": False,
@@ -875,10 +936,11 @@ class Cd2Tool(_PluginBase):
 
     def get_page(self) -> List[dict]:
         page_form = []
+        cd2_clients, cd2_urls = self._cd2_clients, self._cd2_url
         for cd2_name, client in self._clients.items():
-            cd2_client = self._cd2_clients[cd2_name]
-            cd2_url = self._cd2_url[cd2_name]
-            cd2_info = self.__get_cd2_info(client=client, cd2_client=cd2_client)
+            cd2_client = cd2_clients[cd2_name]
+            cd2_url = cd2_urls[cd2_name]
+            cd2_info = self.__get_cd2_info_cached(cd2_name, client, cd2_client)
             page_form.append({
                 'component': 'VRow',
                 'content': [
@@ -1506,10 +1568,11 @@ class Cd2Tool(_PluginBase):
             ]
         else:
             elements = []
+            cd2_clients, cd2_urls = self._cd2_clients, self._cd2_url
             for cd2_name, client in self._clients.items():
-                cd2_client = self._cd2_clients[cd2_name]
-                cd2_url = self._cd2_url[cd2_name]
-                cd2_info = self.__get_cd2_info(client=client, cd2_client=cd2_client)
+                cd2_client = cd2_clients[cd2_name]
+                cd2_url = cd2_urls[cd2_name]
+                cd2_info = self.__get_cd2_info_cached(cd2_name, client, cd2_client)
 
                 elements.append(
                     {
@@ -4,30 +4,33 @@ import json
 import logging.handlers
 import os
 import random
+import re
 import shutil
+import stat
 import threading
 import time
 import traceback
 import uuid
-from dataclasses import dataclass
+import weakref
+from collections import Counter, OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache, wraps
+from itertools import groupby, islice
 from pathlib import Path
-from queue import Queue, PriorityQueue
+from types import MappingProxyType
+from queue import Queue, PriorityQueue, Full, Empty
 from typing import List, Tuple, Dict, Any, Optional, Union
 
-import pytz
-import requests
-from apscheduler.schedulers.background import BackgroundScheduler
-
 try:
-    from clouddrive import CloudDriveClient, Client
+    from clouddrive import CloudDriveClient
     from clouddrive.proto import CloudDrive_pb2
 
     CLOUDDRIVE_AVAILABLE = True
 except ImportError:
     CloudDriveClient = None
-    Client = None
     CloudDrive_pb2 = None
     CLOUDDRIVE_AVAILABLE = False
 
@@ -46,6 +49,74 @@ from app.schemas.types import EventType, MediaType, NotificationType
 
 lock = threading.Lock()
 
+# WebHook处理线程退出信号
+_SHUTDOWN = object()
+
+# 剧集名称中的单季/单集标记（如 " S01"、" S01E02"）
+_SEASON_PATTERN = re.compile(r" S\d{1,2}(?:E\d+)?")
+
+# 每个线程独立的随机数生成器，用于重试抖动
+_rng_local = threading.local()
+
+
+def _rng() -> random.Random:
+    """获取当前线程的随机数生成器"""
+    rng = getattr(_rng_local, 'rng', None)
+    if rng is None:
+        rng = _rng_local.rng = random.Random(os.urandom(8))
+    return rng
+
+
+@lru_cache(maxsize=4096)
+def _translate_dir(dir_path: str, src: str, dst: str) -> str:
+    """将目录的软链接前缀替换为cd2挂载前缀，同目录下的文件共享缓存结果"""
+    if dir_path.startswith(src):
+        return dst + dir_path[len(src):]
+    return dir_path.replace(src, dst, 1)
+
+
+def _translate_path(file_path: str, src: str, dst: str) -> str:
+    """将软链接路径转换为cd2挂载路径"""
+    dir_path, sep, file_name = file_path.rpartition('/')
+    return _translate_dir(dir_path + sep, src, dst) + file_name
+
+
+def _ttl_cached(seconds: float):
+    """在seconds秒内复用方法的上次返回结果，用于被频繁轮询的统计接口"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self):
+            now = time.monotonic()
+            cached = self._api_cache.get(func.__name__)
+            if cached and now - cached[0] < seconds:
+                return cached[1]
+            result = func(self)
+            self._api_cache[func.__name__] = (now, result)
+            return result
+        return wrapper
+    return decorator
+
+
+def _json_bytes(obj) -> bytes:
+    """序列化为紧凑的JSON字节串"""
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _is_rate_limited(err: Exception, err_text: str = None) -> bool:
+    """判断异常是否为访问频率限制（HTTP 429 / gRPC RESOURCE_EXHAUSTED）"""
+    response = getattr(err, 'response', None)
+    status_code = getattr(response, 'status_code', None)
+    if status_code is not None:
+        return status_code == 429
+    code = getattr(err, 'code', None)
+    if callable(code):
+        try:
+            return getattr(code(), 'name', None) == 'RESOURCE_EXHAUSTED'
+        except Exception:
+            pass
+    # 无法从异常类型判断时退回到文本匹配
+    return "429" in (err_text if err_text is not None else str(err))
+
 
 class UploadPriority(Enum):
     """上传任务优先级"""
@@ -64,9 +135,41 @@ class ErrorType(Enum):
     UNKNOWN_ERROR = "unknown"  # 未知错误，可重试
 
 
-@dataclass
+# 错误信息关键字，分组顺序即匹配优先级
+_ERROR_PATTERN = re.compile(
+    r"(?P<permission>permission|access)"
+    r"|(?P<disk_full>no space|disk full)"
+    r"|(?P<file_not_found>not found|no such file)"
+    r"|(?P<network>network|timeout|connection)"
+    r"|(?P<temporary>temporary|busy)",
+    re.IGNORECASE
+)
+_ERROR_PRIORITY = (
+    ("permission", ErrorType.PERMISSION_ERROR),
+    ("disk_full", ErrorType.DISK_FULL),
+    ("file_not_found", ErrorType.FILE_NOT_FOUND),
+    ("network", ErrorType.NETWORK_ERROR),
+    ("temporary", ErrorType.TEMPORARY_ERROR),
+)
+# 分组名 -> (优先级, 错误类型)
+_ERROR_RANK = {group: (rank, error_type) for rank, (group, error_type) in enumerate(_ERROR_PRIORITY)}
+# 不可重试的错误类型
+_NON_RETRYABLE_ERRORS = frozenset((ErrorType.PERMISSION_ERROR, ErrorType.FILE_NOT_FOUND))
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """重试策略（配置加载时生成快照）"""
+    max_attempts: int = 5
+    base_delay: float = 2
+    max_delay: float = 300
+    enable_jitter: bool = True
+    smart: bool = True
+
+
+@dataclass(slots=True)
 class UploadTask:
-    """上传任务数据类"""
+    """上传任务数据类（每个待上传文件一个实例，使用__slots__减小内存占用）"""
     file_path: str
     cd2_dest: str
     priority: UploadPriority = UploadPriority.NORMAL
@@ -77,10 +180,16 @@ class UploadTask:
     last_error: str = None
     error_type: ErrorType = None
     next_retry_time: float = None
+    prev_delay: float = None
+    # 由file_path派生，构造时计算一次
+    basename: str = field(init=False, default=None)
+    strm_path: str = field(init=False, default=None)
 
     def __post_init__(self):
         if self.created_time is None:
             self.created_time = time.time()
+        self.basename = os.path.basename(self.file_path)
+        self.strm_path = os.path.splitext(self.file_path)[0] + '.strm'
 
     def __lt__(self, other):
         # 优先级越小越优先，如果优先级相同按创建时间排序
@@ -88,22 +197,22 @@ class UploadTask:
             return self.created_time < other.created_time
         return self.priority.value < other.priority.value
 
-    def is_ready_for_retry(self) -> bool:
-        """检查是否准备好重试"""
+    def is_ready_for_retry(self, now: float = None) -> bool:
+        """检查是否准备好重试，now为调用方批量检查时统一取的当前时间"""
         if self.next_retry_time is None:
             return True
-        return time.time() >= self.next_retry_time
+        return (now if now is not None else time.time()) >= self.next_retry_time
 
     def calculate_next_retry_time(self, base_delay: int = 2, max_delay: int = 300, enable_jitter: bool = True) -> float:
         """计算下次重试时间"""
-        # 指数退避算法
-        delay = min(base_delay * (2 ** self.retry_count), max_delay)
-
-        # 添加抖动避免雷群效应
         if enable_jitter:
-            jitter = random.uniform(0, delay * 0.1)
-            delay += jitter
+            # 去相关抖动退避，避免雷群效应
+            delay = min(max_delay, _rng().uniform(base_delay, (self.prev_delay or base_delay) * 3))
+        else:
+            # 指数退避算法
+            delay = min(base_delay * (2 ** self.retry_count), max_delay)
 
+        self.prev_delay = delay
         self.next_retry_time = time.time() + delay
         return self.next_retry_time
 
@@ -115,7 +224,7 @@ class UploadQueue:
         self.queue = PriorityQueue()
         self.active_uploads = {}  # 正在上传的任务
         self.completed_uploads = []  # 已完成的任务
-        self.failed_uploads = []  # 失败的任务
+        self.failed_uploads = deque(maxlen=256)  # 失败的任务（有界）
         self.max_concurrent = max_concurrent_uploads
         self.lock = threading.Lock()
         self.stats = {
@@ -131,15 +240,23 @@ class UploadQueue:
             self.queue.put(task)
             self.stats['total_queued'] += 1
 
+    def add_tasks_bulk(self, tasks: List[UploadTask]):
+        """批量添加上传任务到队列，只获取一次锁"""
+        with self.lock:
+            for task in tasks:
+                self.queue.put(task)
+            self.stats['total_queued'] += len(tasks)
+
     def get_next_task(self) -> Optional[UploadTask]:
         """获取下一个待执行的任务"""
         try:
             if len(self.active_uploads) < self.max_concurrent:
-                # 寻找准备好重试的任务
+                # 寻找准备好重试的任务，本轮扫描统一使用同一时间点比较
+                now = time.time()
                 temp_tasks = []
                 while not self.queue.empty():
                     task = self.queue.get_nowait()
-                    if task.is_ready_for_retry():
+                    if task.is_ready_for_retry(now):
                         self.active_uploads[task.file_path] = task
                         # 将暂存的任务重新放回队列
                         for temp_task in temp_tasks:
@@ -194,14 +311,14 @@ class UploadQueue:
 
     def get_queue_status(self) -> Dict:
         """获取队列状态"""
-        with self.lock:
-            return {
-                'queued': self.queue.qsize(),
-                'active': len(self.active_uploads),
-                'completed': len(self.completed_uploads),
-                'failed': len(self.failed_uploads),
-                'stats': self.stats.copy()
-            }
+        # 各项读取（len、dict.copy）本身是原子的，状态查询无需与上传线程争用锁
+        return {
+            'queued': self.queue.qsize(),
+            'active': len(self.active_uploads),
+            'completed': len(self.completed_uploads),
+            'failed': len(self.failed_uploads),
+            'stats': self.stats.copy()
+        }
 
     def clear_completed_history(self):
         """清理已完成的历史记录"""
@@ -210,83 +327,93 @@ class UploadQueue:
             if len(self.completed_uploads) > 100:
                 self.completed_uploads = self.completed_uploads[-100:]
             # 只保留最近50条失败记录
-            if len(self.failed_uploads) > 50:
-                self.failed_uploads = self.failed_uploads[-50:]
+            while len(self.failed_uploads) > 50:
+                self.failed_uploads.popleft()
+
+
+def _new_stat_bucket() -> Dict:
+    """新建统计分桶"""
+    return {'attempts': 0, 'success': 0, 'failed': 0, 'size': 0}
 
 
 class UploadStatistics:
     """上传统计管理器"""
 
     def __init__(self):
-        self.daily_stats = {}  # 按日期统计
-        self.hourly_stats = {}  # 按小时统计
-        self.file_type_stats = {}  # 按文件类型统计
-        self.error_stats = {}  # 错误统计
+        self.daily_stats = defaultdict(_new_stat_bucket)  # 按日期统计
+        self.hourly_stats = defaultdict(_new_stat_bucket)  # 按小时统计
+        self.file_type_stats = defaultdict(_new_stat_bucket)  # 按文件类型统计
+        self.error_stats = Counter()  # 错误统计
         self.performance_stats = {
-            'avg_upload_time': 0,
+            # 平均上传时间在读取时由总耗时/次数计算
+            'total_upload_time': 0,
+            'timed_uploads': 0,
             'total_uploaded_size': 0,
+            # 保留期内（daily_stats 中）的成功/失败总数，随记录累加、清理时扣减，读取时无需遍历
+            'total_success': 0,
+            'total_failed': 0,
             'peak_concurrent_uploads': 0,
             'uptime_start': time.time()
         }
         self.lock = threading.Lock()
 
+    @staticmethod
+    def _stat_keys(file_path: str) -> Tuple[str, str, str]:
+        """计算日期、小时及文件类型统计键（锁外计算，同一次记录使用同一时间）"""
+        now = datetime.now()
+        return now.strftime('%Y-%m-%d'), now.strftime('%Y-%m-%d %H:00'), os.path.splitext(file_path)[1].lower()
+
     def record_upload_attempt(self, file_path: str, file_size: int = 0):
         """记录上传尝试"""
-        today = datetime.now().strftime('%Y-%m-%d')
-        hour = datetime.now().strftime('%Y-%m-%d %H:00')
-        file_ext = os.path.splitext(file_path)[1].lower()
+        today, hour, file_ext = self._stat_keys(file_path)
 
         with self.lock:
             # 日统计
-            if today not in self.daily_stats:
-                self.daily_stats[today] = {'attempts': 0, 'success': 0, 'failed': 0, 'size': 0}
             self.daily_stats[today]['attempts'] += 1
-
             # 小时统计
-            if hour not in self.hourly_stats:
-                self.hourly_stats[hour] = {'attempts': 0, 'success': 0, 'failed': 0, 'size': 0}
             self.hourly_stats[hour]['attempts'] += 1
-
             # 文件类型统计
-            if file_ext not in self.file_type_stats:
-                self.file_type_stats[file_ext] = {'attempts': 0, 'success': 0, 'failed': 0, 'size': 0}
-            self.file_type_stats[file_ext]['attempts'] += 1
-            self.file_type_stats[file_ext]['size'] += file_size
+            ext_stats = self.file_type_stats[file_ext]
+            ext_stats['attempts'] += 1
+            ext_stats['size'] += file_size
 
     def record_upload_result(self, file_path: str, success: bool, duration: float = 0, file_size: int = 0,
                              error_type: str = None):
         """记录上传结果"""
-        today = datetime.now().strftime('%Y-%m-%d')
-        hour = datetime.now().strftime('%Y-%m-%d %H:00')
-        file_ext = os.path.splitext(file_path)[1].lower()
+        today, hour, file_ext = self._stat_keys(file_path)
 
         with self.lock:
+            # 上传跨越整点/零点时，结果所在的分桶可能尚不存在
+            daily = self.daily_stats[today]
+            hourly = self.hourly_stats[hour]
+            ext_stats = self.file_type_stats[file_ext]
             # 更新各项统计
             if success:
-                self.daily_stats[today]['success'] += 1
-                self.hourly_stats[hour]['success'] += 1
-                self.file_type_stats[file_ext]['success'] += 1
+                daily['success'] += 1
+                hourly['success'] += 1
+                ext_stats['success'] += 1
+                self.performance_stats['total_success'] += 1
                 self.performance_stats['total_uploaded_size'] += file_size
 
-                # 更新平均上传时间
+                # 累计上传耗时
                 if duration > 0:
-                    current_avg = self.performance_stats['avg_upload_time']
-                    total_success = sum(stats['success'] for stats in self.daily_stats.values())
-                    self.performance_stats['avg_upload_time'] = (current_avg * (
-                                total_success - 1) + duration) / total_success
+                    self.performance_stats['total_upload_time'] += duration
+                    self.performance_stats['timed_uploads'] += 1
             else:
-                self.daily_stats[today]['failed'] += 1
-                self.hourly_stats[hour]['failed'] += 1
-                self.file_type_stats[file_ext]['failed'] += 1
+                daily['failed'] += 1
+                hourly['failed'] += 1
+                ext_stats['failed'] += 1
+                self.performance_stats['total_failed'] += 1
 
                 # 错误统计
                 if error_type:
-                    if error_type not in self.error_stats:
-                        self.error_stats[error_type] = 0
                     self.error_stats[error_type] += 1
 
     def update_concurrent_peak(self, current_concurrent: int):
         """更新并发峰值"""
+        # 未超过峰值时无需加锁（绝大多数情况）
+        if current_concurrent <= self.performance_stats['peak_concurrent_uploads']:
+            return
         with self.lock:
             if current_concurrent > self.performance_stats['peak_concurrent_uploads']:
                 self.performance_stats['peak_concurrent_uploads'] = current_concurrent
@@ -299,9 +426,8 @@ class UploadStatistics:
 
             for i in range(days):
                 date_key = (base_date + timedelta(days=i)).strftime('%Y-%m-%d')
-                recent_days[date_key] = self.daily_stats.get(date_key, {
-                    'attempts': 0, 'success': 0, 'failed': 0, 'size': 0
-                })
+                # 只读查询，不向 defaultdict 插入空分桶
+                recent_days[date_key] = self.daily_stats.get(date_key) or _new_stat_bucket()
 
             return recent_days
 
@@ -309,8 +435,8 @@ class UploadStatistics:
         """获取性能统计摘要"""
         with self.lock:
             uptime = time.time() - self.performance_stats['uptime_start']
-            total_success = sum(stats['success'] for stats in self.daily_stats.values())
-            total_failed = sum(stats['failed'] for stats in self.daily_stats.values())
+            total_success = self.performance_stats['total_success']
+            total_failed = self.performance_stats['total_failed']
 
             return {
                 'uptime_hours': round(uptime / 3600, 2),
@@ -318,7 +444,9 @@ class UploadStatistics:
                 'total_failures': total_failed,
                 'success_rate': round(total_success / (total_success + total_failed) * 100, 2) if (
                                                                                                               total_success + total_failed) > 0 else 0,
-                'avg_upload_time': round(self.performance_stats['avg_upload_time'], 2),
+                'avg_upload_time': round(self.performance_stats['total_upload_time'] /
+                                         self.performance_stats['timed_uploads'], 2)
+                if self.performance_stats['timed_uploads'] else 0,
                 'total_uploaded_size_gb': round(self.performance_stats['total_uploaded_size'] / (1024 ** 3), 2),
                 'peak_concurrent_uploads': self.performance_stats['peak_concurrent_uploads'],
                 'uploads_per_hour': round(total_success / (uptime / 3600), 2) if uptime > 0 else 0
@@ -327,7 +455,7 @@ class UploadStatistics:
     def get_error_analysis(self) -> Dict:
         """获取错误分析"""
         with self.lock:
-            return dict(sorted(self.error_stats.items(), key=lambda x: x[1], reverse=True))
+            return dict(self.error_stats.most_common())
 
     def cleanup_old_data(self, keep_days: int = 30):
         """清理旧数据"""
@@ -335,12 +463,20 @@ class UploadStatistics:
         cutoff_str = cutoff_date.strftime('%Y-%m-%d')
 
         with self.lock:
-            # 清理日统计
-            self.daily_stats = {k: v for k, v in self.daily_stats.items() if k >= cutoff_str}
+            # 清理日统计，同时从累计总数中扣除被清理的天
+            kept = {}
+            for k, v in self.daily_stats.items():
+                if k >= cutoff_str:
+                    kept[k] = v
+                else:
+                    self.performance_stats['total_success'] -= v['success']
+                    self.performance_stats['total_failed'] -= v['failed']
+            self.daily_stats = defaultdict(_new_stat_bucket, kept)
 
             # 清理小时统计
             cutoff_hour = cutoff_date.strftime('%Y-%m-%d %H:00')
-            self.hourly_stats = {k: v for k, v in self.hourly_stats.items() if k >= cutoff_hour}
+            self.hourly_stats = defaultdict(_new_stat_bucket,
+                                            {k: v for k, v in self.hourly_stats.items() if k >= cutoff_hour})
 
 
 class EnterpriseLogger:
@@ -402,59 +538,40 @@ class EnterpriseLogger:
 
         return logger
 
-    def log_business_event(self, event_type: str, details: Dict, user_id: str = None,
-                           file_path: str = None, status: str = "INFO"):
-        """记录业务事件"""
+    def _write(self, target: logging.Logger, level: int, **fields):
+        """补充会话信息后以JSON写入指定日志，日志级别未启用时不做序列化"""
+        if not target.isEnabledFor(level):
+            return
         log_entry = {
             "session_id": self.session_id,
             "timestamp": datetime.now().isoformat(),
-            "event_type": event_type,
-            "user_id": user_id or "system",
-            "file_path": file_path,
-            "status": status,
-            "details": details
+            **fields
         }
-        self.business_logger.info(json.dumps(log_entry, ensure_ascii=False))
+        target.log(level, json.dumps(log_entry, ensure_ascii=False))
+
+    def log_business_event(self, event_type: str, details: Dict, user_id: str = None,
+                           file_path: str = None, status: str = "INFO"):
+        """记录业务事件"""
+        self._write(self.business_logger, logging.INFO, event_type=event_type, user_id=user_id or "system",
+                    file_path=file_path, status=status, details=details)
 
     def log_performance_metric(self, metric_name: str, value: Union[int, float],
                                unit: str = None, tags: Dict = None):
         """记录性能指标"""
-        log_entry = {
-            "session_id": self.session_id,
-            "timestamp": datetime.now().isoformat(),
-            "metric_name": metric_name,
-            "value": value,
-            "unit": unit,
-            "tags": tags or {}
-        }
-        self.performance_logger.info(json.dumps(log_entry, ensure_ascii=False))
+        self._write(self.performance_logger, logging.INFO, metric_name=metric_name, value=value, unit=unit,
+                    tags=tags or {})
 
     def log_audit_event(self, action: str, resource: str, user_id: str = None,
                         result: str = "SUCCESS", details: Dict = None):
         """记录审计事件"""
-        log_entry = {
-            "session_id": self.session_id,
-            "timestamp": datetime.now().isoformat(),
-            "action": action,
-            "resource": resource,
-            "user_id": user_id or "system",
-            "result": result,
-            "details": details or {}
-        }
-        self.audit_logger.info(json.dumps(log_entry, ensure_ascii=False))
+        self._write(self.audit_logger, logging.INFO, action=action, resource=resource, user_id=user_id or "system",
+                    result=result, details=details or {})
 
     def log_error(self, error_type: str, error_message: str, stack_trace: str = None,
                   context: Dict = None):
         """记录错误"""
-        log_entry = {
-            "session_id": self.session_id,
-            "timestamp": datetime.now().isoformat(),
-            "error_type": error_type,
-            "error_message": error_message,
-            "stack_trace": stack_trace,
-            "context": context or {}
-        }
-        self.error_logger.error(json.dumps(log_entry, ensure_ascii=False))
+        self._write(self.error_logger, logging.ERROR, error_type=error_type, error_message=error_message,
+                    stack_trace=stack_trace, context=context or {})
 
 
 class DistributedLock:
@@ -465,22 +582,29 @@ class DistributedLock:
         self.timeout = timeout
         self.lock_id = str(uuid.uuid4())
         self.acquired = False
-        self.lock_file = Path(f"/tmp/cd2upload_lock_{hashlib.md5(resource_name.encode()).hexdigest()}")
+        # 锁文件路径保持为字符串，直接交给open/os.unlink，无需Path对象
+        self.lock_file = f"/tmp/cd2upload_lock_{hashlib.md5(resource_name.encode()).hexdigest()}"
 
     def acquire(self) -> bool:
         """获取锁"""
         try:
             current_time = time.time()
 
-            # 检查锁文件是否存在
-            if self.lock_file.exists():
+            # 读取已有锁文件，不存在时由异常判断，省去一次exists
+            try:
                 with open(self.lock_file, 'r') as f:
                     lock_data = json.loads(f.read())
+            except FileNotFoundError:
+                lock_data = None
 
+            if lock_data is not None:
                 # 检查锁是否过期
                 if current_time - lock_data['acquired_time'] > self.timeout:
                     # 锁已过期，删除旧锁
-                    self.lock_file.unlink(missing_ok=True)
+                    try:
+                        os.unlink(self.lock_file)
+                    except FileNotFoundError:
+                        pass
                 else:
                     return False
 
@@ -507,15 +631,15 @@ class DistributedLock:
             if not self.acquired:
                 return True
 
-            if not self.lock_file.exists():
+            try:
+                with open(self.lock_file, 'r') as f:
+                    lock_data = json.loads(f.read())
+            except FileNotFoundError:
                 return True
 
-            with open(self.lock_file, 'r') as f:
-                lock_data = json.loads(f.read())
-
             # 验证锁的所有权
             if lock_data['lock_id'] == self.lock_id:
-                self.lock_file.unlink()
+                os.unlink(self.lock_file)
                 self.acquired = False
                 return True
 
@@ -647,17 +771,15 @@ class HealthChecker:
         """检查存储健康状态"""
         try:
             # 检查软链接目录
-            softlink_path = Path(self.plugin._softlink_prefix_path)
-            if not softlink_path.exists():
+            if not os.path.exists(self.plugin._softlink_prefix_path):
                 return {"status": "warning", "message": "软链接目录不存在"}
 
-            # 检查CloudDrive2挂载目录
-            cd2_path = Path(self.plugin._cd_mount_prefix_path)
-            if not cd2_path.parent.exists():
+            # 检查CloudDrive2挂载目录及磁盘空间，挂载盘上每次系统调用都有往返开销，
+            # 直接statvfs，目录不存在时由异常判断，不再单独exists
+            try:
+                statvfs = os.statvfs(Path(self.plugin._cd_mount_prefix_path).parent)
+            except FileNotFoundError:
                 return {"status": "warning", "message": "CloudDrive2挂载目录不存在"}
-
-            # 检查磁盘空间
-            statvfs = os.statvfs(cd2_path.parent)
             free_space = statvfs.f_bavail * statvfs.f_frsize
             total_space = statvfs.f_blocks * statvfs.f_frsize
             usage_percent = (1 - free_space / total_space) * 100
@@ -835,10 +957,11 @@ class APIHandler:
 
         # 加入上传队列
         if self.plugin._upload_queue:
-            for file_path in files:
-                cd2_dest = file_path.replace(self.plugin._softlink_prefix_path, self.plugin._cd_mount_prefix_path)
-                task = UploadTask(file_path=file_path, cd2_dest=cd2_dest, priority=UploadPriority.HIGH)
-                self.plugin._upload_queue.add_task(task)
+            to_cd2_path = self.plugin._to_cd2_path
+            tasks = [UploadTask(file_path=file_path, cd2_dest=to_cd2_path(file_path),
+                                priority=UploadPriority.HIGH)
+                     for file_path in files]
+            self.plugin._upload_queue.add_tasks_bulk(tasks)
 
         return {"message": f"已加入 {len(files)} 个文件到上传队列", "code": 200}
 
@@ -862,9 +985,19 @@ class WebHookManager:
     """WebHook管理器"""
 
     def __init__(self, plugin_instance):
-        self.plugin = plugin_instance
+        # 弱引用插件实例：发送线程在重试等待中可能晚于stop()退出，避免其持有已卸载的插件
+        self.plugin = weakref.proxy(plugin_instance)
         self.webhooks = {}
-        self.webhook_queue = Queue()
+        self._lock = threading.Lock()
+        # 只读快照：(webhook_id -> webhook, event_type -> webhook_id集合)
+        # 注册/注销时整体替换（写时复制），触发时无需加锁即可安全遍历
+        self._snapshot = (MappingProxyType({}), {})
+        # 有界队列，接收端长时间不可用时丢弃最旧事件，避免内存无限增长
+        self.webhook_queue = Queue(maxsize=5000)
+        # 单次从队列取出的最大事件数
+        self.max_batch = 100
+        # 发送线程复用的HTTP会话（保持长连接），首次发送时创建
+        self._session = None
         self.webhook_thread = None
         self._running = False
 
@@ -880,21 +1013,41 @@ class WebHookManager:
     def stop(self):
         """停止WebHook处理"""
         self._running = False
+        try:
+            self.webhook_queue.put_nowait(_SHUTDOWN)
+        except Full:
+            # 队列已满时丢弃最旧事件，保证退出信号能送达
+            try:
+                self.webhook_queue.get_nowait()
+            except Empty:
+                pass
+            self.webhook_queue.put_nowait(_SHUTDOWN)
         if self.webhook_thread:
             self.webhook_thread.join(timeout=5)
+        if self._session:
+            self._session.close()
+            self._session = None
 
     def register_webhook(self, event_type: str, url: str, secret: str = None,
-                         headers: Dict = None, retry_count: int = 3):
-        """注册WebHook"""
+                         headers: Dict = None, retry_count: int = 3, batch: bool = False):
+        """注册WebHook，batch为True时同一批次的多个事件合并为一次请求发送"""
         webhook_id = str(uuid.uuid4())
-        self.webhooks[webhook_id] = {
+        webhook = {
             "event_type": event_type,
             "url": url,
             "secret": secret,
             "headers": headers or {},
             "retry_count": retry_count,
+            "batch": batch,
             "created_time": datetime.now().isoformat()
         }
+        # 预先完成HMAC密钥初始化，发送时复制即可
+        if secret:
+            webhook["_hmac"] = hmac.new(secret.encode('utf-8'), digestmod=hashlib.sha256)
+
+        with self._lock:
+            self.webhooks[webhook_id] = webhook
+            self._refresh_snapshot()
 
         if self.plugin._enterprise_logger:
             self.plugin._enterprise_logger.log_audit_event(
@@ -907,9 +1060,12 @@ class WebHookManager:
 
     def unregister_webhook(self, webhook_id: str) -> bool:
         """注销WebHook"""
-        if webhook_id in self.webhooks:
-            del self.webhooks[webhook_id]
+        with self._lock:
+            removed = self.webhooks.pop(webhook_id, None) is not None
+            if removed:
+                self._refresh_snapshot()
 
+        if removed:
             if self.plugin._enterprise_logger:
                 self.plugin._enterprise_logger.log_audit_event(
                     "webhook_unregistered",
@@ -918,75 +1074,164 @@ class WebHookManager:
             return True
         return False
 
+    def _refresh_snapshot(self):
+        """重建只读快照及事件索引，需在持有self._lock时调用"""
+        webhooks = self.webhooks.copy()
+        index = defaultdict(set)
+        for webhook_id, webhook in webhooks.items():
+            index[webhook["event_type"]].add(webhook_id)
+        self._snapshot = (MappingProxyType(webhooks),
+                          {event_type: frozenset(ids) for event_type, ids in index.items()})
+
     def trigger_webhook(self, event_type: str, data: Dict):
         """触发WebHook"""
-        for webhook_id, webhook in self.webhooks.items():
-            if webhook["event_type"] == event_type or webhook["event_type"] == "*":
-                self.webhook_queue.put({
-                    "webhook_id": webhook_id,
-                    "webhook": webhook,
-                    "data": data,
-                    "timestamp": datetime.now().isoformat()
-                })
+        webhooks, index = self._snapshot
+        timestamp = datetime.now().isoformat()
+        for webhook_id in index.get(event_type, frozenset()) | index.get("*", frozenset()):
+            webhook_event = {
+                "webhook_id": webhook_id,
+                "webhook": webhooks[webhook_id],
+                "data": data,
+                "timestamp": timestamp
+            }
+            try:
+                self.webhook_queue.put_nowait(webhook_event)
+            except Full:
+                # 队列已满，丢弃最旧的事件
+                try:
+                    dropped = self.webhook_queue.get_nowait()
+                except Empty:
+                    dropped = None
+                try:
+                    self.webhook_queue.put_nowait(webhook_event)
+                except Full:
+                    dropped = webhook_event
+
+                if dropped and self.plugin._enterprise_logger:
+                    self.plugin._enterprise_logger.log_error(
+                        "webhook_queue_full",
+                        "WebHook队列已满，丢弃最旧事件",
+                        context={
+                            "webhook_id": dropped["webhook_id"],
+                            "queue_size": self.webhook_queue.maxsize
+                        }
+                    )
 
     def _process_webhooks(self):
         """处理WebHook队列"""
-        while self._running:
-            try:
-                webhook_event = self.webhook_queue.get(timeout=1)
-                self._send_webhook(webhook_event)
-            except:
-                continue
+        while True:
+            webhook_event = self.webhook_queue.get()
+            if webhook_event is _SHUTDOWN or not self._running:
+                break
+
+            # 一次取出当前已排队的全部事件（不等待凑批），按WebHook分组
+            shutdown = False
+            grouped = defaultdict(list)
+            grouped[webhook_event["webhook_id"]].append(webhook_event)
+            for _ in range(self.max_batch - 1):
+                try:
+                    webhook_event = self.webhook_queue.get_nowait()
+                except Empty:
+                    break
+                if webhook_event is _SHUTDOWN:
+                    shutdown = True
+                    break
+                grouped[webhook_event["webhook_id"]].append(webhook_event)
+
+            for events in grouped.values():
+                try:
+                    if events[0]["webhook"].get("batch"):
+                        self._send_webhook(events)
+                    else:
+                        for event in events:
+                            self._send_webhook([event])
+                except Exception as e:
+                    logger.error(f"处理WebHook事件失败: {e}\n{traceback.format_exc()}")
+
+            if shutdown or not self._running:
+                break
+
+    def _send_webhook(self, webhook_events: List[Dict]):
+        """发送WebHook，多个事件时以events数组合并发送"""
+        # 发送期间使用的插件设置先取出，插件实例已被回收（卸载后线程仍在排空队列）时直接丢弃
+        try:
+            api_timeout = self.plugin._api_timeout
+            retry_base_delay = self.plugin._retry_base_delay
+            retry_max_delay = self.plugin._retry_max_delay
+            enterprise_logger = self.plugin._enterprise_logger
+        except ReferenceError:
+            return
+
+        # 延迟导入，未启用WebHook时不加载requests
+        import requests
+
+        if self._session is None:
+            from requests.adapters import HTTPAdapter
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
 
-    def _send_webhook(self, webhook_event: Dict):
-        """发送WebHook"""
+        webhook_event = webhook_events[0]
         webhook = webhook_event["webhook"]
-        data = webhook_event["data"]
 
-        payload = {
-            "event_type": webhook["event_type"],
-            "data": data,
-            "timestamp": webhook_event["timestamp"]
-        }
+        if len(webhook_events) == 1:
+            payload = {
+                "event_type": webhook["event_type"],
+                "data": webhook_event["data"],
+                "timestamp": webhook_event["timestamp"]
+            }
+        else:
+            payload = {
+                "event_type": webhook["event_type"],
+                "events": [{"data": event["data"], "timestamp": event["timestamp"]}
+                           for event in webhook_events]
+            }
 
         headers = webhook["headers"].copy()
         headers["Content-Type"] = "application/json"
 
+        # 只序列化一次，签名与发送使用同一份字节
+        body = _json_bytes(payload)
+
         # 添加签名（如果有密钥）
-        if webhook.get("secret"):
-            signature = self._generate_signature(webhook["secret"], json.dumps(payload))
-            headers["X-Signature"] = signature
+        if webhook.get("_hmac"):
+            headers["X-Signature"] = self._generate_signature(webhook["_hmac"], body)
 
         # 重试逻辑
         for attempt in range(webhook["retry_count"]):
+            retryable = True
             try:
-                response = requests.post(
+                response = self._session.post(
                     webhook["url"],
-                    json=payload,
+                    data=body,
                     headers=headers,
-                    timeout=30
+                    timeout=api_timeout
                 )
 
                 if response.status_code < 400:
                     # 成功
-                    if self.plugin._enterprise_logger:
-                        self.plugin._enterprise_logger.log_business_event(
+                    if enterprise_logger:
+                        enterprise_logger.log_business_event(
                             "webhook_sent",
                             {
                                 "webhook_id": webhook_event["webhook_id"],
                                 "status_code": response.status_code,
-                                "attempt": attempt + 1
+                                "attempt": attempt + 1,
+                                "events": len(webhook_events)
                             }
                         )
                     break
                 else:
+                    # 4xx（408/429除外）属于请求本身的问题，重试无意义
+                    retryable = response.status_code >= 500 or response.status_code in (408, 429)
                     raise requests.RequestException(f"HTTP {response.status_code}")
 
             except Exception as e:
-                if attempt == webhook["retry_count"] - 1:
-                    # 最后一次尝试失败
-                    if self.plugin._enterprise_logger:
-                        self.plugin._enterprise_logger.log_error(
+                if not retryable or attempt == webhook["retry_count"] - 1:
+                    # 不可重试或最后一次尝试失败
+                    if enterprise_logger:
+                        enterprise_logger.log_error(
                             "webhook_failed",
                             str(e),
                             context={
@@ -995,18 +1240,17 @@ class WebHookManager:
                                 "attempts": attempt + 1
                             }
                         )
+                    break
                 else:
-                    # 等待后重试
-                    time.sleep(2 ** attempt)
+                    # 等待后重试（全抖动指数退避，避免雷群效应）
+                    time.sleep(_rng().uniform(0, min(retry_max_delay, retry_base_delay * (2 ** attempt))))
 
-    def _generate_signature(self, secret: str, payload: str) -> str:
+    @staticmethod
+    def _generate_signature(hmac_key: hmac.HMAC, payload: bytes) -> str:
         """生成WebHook签名"""
-        signature = hmac.new(
-            secret.encode('utf-8'),
-            payload.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        return f"sha256={signature}"
+        signer = hmac_key.copy()
+        signer.update(payload)
+        return f"sha256={signer.hexdigest()}"
 
     def list_webhooks(self) -> List[Dict]:
         """列出所有WebHook"""
@@ -1017,66 +1261,835 @@ class WebHookManager:
                 "url": webhook["url"],
                 "created_time": webhook["created_time"]
             }
-            for webhook_id, webhook in self.webhooks.items()
+            for webhook_id, webhook in self._snapshot[0].items()
         ]
 
 
-class Cd2Upload(_PluginBase):
-    # 插件名称
-    plugin_name = "CloudDrive2智能上传"
-    # 插件描述
-    plugin_desc = "智能上传媒体文件到CloudDrive2，支持上传监控、任务管理、通知Cloud Media Sync处理后续文件管理"
-    # 插件图标
-    plugin_icon = "https://raw.githubusercontent.com/thsrite/MoviePilot-Plugins/main/icons/clouddrive.png"
-    # 插件版本
-    plugin_version = "2.2.0"
-    # 插件作者
-    plugin_author = "honue & enhanced"
-    # 作者主页
-    author_url = "https://github.com/honue"
-    # 插件配置项ID前缀
-    plugin_config_prefix = "cd2upload_"
-    # 加载顺序
-    plugin_order = 1
-    # 可使用的用户级别
-    auth_level = 1
-
-    _enable = True
-    _cron = '20'
-    _onlyonce = False
-    _cleanlink = False
-    _monitor_upload = True
-    _notify_upload = False
-    _upload_retry_count = 3
-    _cd2_confs = None
-    _cloud_media_sync = True
-    _monitor_interval = 10
-    _clean_interval = 20
-    _enable_cookie_check = True
-    _cookie_check_interval = 30
-    _black_dirs = ""
-    _upload_timeout = 300
-    _delete_source_after_upload = False
-    _enable_favorite_notify = True
-    _notification_type = "Plugin"
-    _notification_channels = ""
-    _enable_progress_notify = False
-    _enable_detailed_stats = True
-
-    # 上传队列管理配置
-    _enable_queue_management = True
-    _max_concurrent_uploads = 3
-    _queue_check_interval = 5
+# 插件配置页面（静态结构，模块加载时构建一次）
+_FORM_SCHEMA = [
+    {
+        'component': 'VForm',
+        'content': [
+            # 企业级Header
+            {
+                'component': 'VCard',
+                'props': {
+                    'variant': 'outlined',
+                    'class': 'mb-4 enterprise-header-card'
+                },
+                'content': [
+                    {
+                        'component': 'VCardItem',
+                        'content': [
+                            {
+                                'component': 'VCardTitle',
+                                'props': {
+                                    'class': 'd-flex align-center'
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VIcon',
+                                        'props': {
+                                            'icon': 'mdi-cloud-upload',
+                                            'class': 'me-3',
+                                            'color': 'primary',
+                                            'size': 'large'
+                                        }
+                                    },
+                                    {
+                                        'component': 'div',
+                                        'props': {
+                                            'class': 'text-h5'
+                                        },
+                                        'content': [
+                                            {
+                                                'component': 'span',
+                                                'text': 'CloudDrive2 智能上传'
+                                            },
+                                            {
+                                                'component': 'VChip',
+                                                'props': {
+                                                    'size': 'small',
+                                                    'color': 'success',
+                                                    'variant': 'flat',
+                                                    'class': 'ms-3'
+                                                },
+                                                'content': [
+                                                    {
+                                                        'component': 'VIcon',
+                                                        'props': {
+                                                            'icon': 'mdi-crown',
+                                                            'start': True,
+                                                            'size': 'small'
+                                                        }
+                                                    },
+                                                    {
+                                                        'component': 'span',
+                                                        'text': 'Enterprise'
+                                                    }
+                                                ]
+                                            }
+                                        ]
+                                    }
+                                ]
+                            },
+                            {
+                                'component': 'VCardSubtitle',
+                                'props': {
+                                    'class': 'mt-2 text-medium-emphasis'
+                                },
+                                'content': [
+                                    {
+                                        'component': 'span',
+                                        'text': '企业级文件上传管理系统 | 队列管理 | 健康监控 | API集成 | 实时统计'
+                                    }
+                                ]
+                            }
+                        ]
+                    }
+                ]
+            },
 
-    # 增强错误处理配置
-    _enable_smart_retry = True
-    _max_retry_attempts = 5
-    _retry_base_delay = 2
-    _retry_max_delay = 300
-    _enable_jitter = True
+            # 快速操作面板
+            {
+                'component': 'VRow',
+                'props': {
+                    'class': 'mb-4'
+                },
+                'content': [
+                    {
+                        'component': 'VCol',
+                        'props': {
+                            'cols': 12,
+                            'md': 3
+                        },
+                        'content': [
+                            {
+                                'component': 'VSwitch',
+                                'props': {
+                                    'model': 'enable',
+                                    'label': '启用插件',
+                                    'color': 'primary',
+                                    'hide-details': True
+                                }
+                            }
+                        ]
+                    },
+                    {
+                        'component': 'VCol',
+                        'props': {
+                            'cols': 12,
+                            'md': 3
+                        },
+                        'content': [
+                            {
+                                'component': 'VSwitch',
+                                'props': {
+                                    'model': 'onlyonce',
+                                    'label': '立即运行一次',
+                                    'color': 'warning',
+                                    'hide-details': True
+                                }
+                            }
+                        ]
+                    },
+                    {
+                        'component': 'VCol',
+                        'props': {
+                            'cols': 12,
+                            'md': 3
+                        },
+                        'content': [
+                            {
+                                'component': 'VSwitch',
+                                'props': {
+                                    'model': 'cleanlink',
+                                    'label': '立即清理',
+                                    'color': 'error',
+                                    'hide-details': True
+                                }
+                            }
+                        ]
+                    },
+                    {
+                        'component': 'VCol',
+                        'props': {
+                            'cols': 12,
+                            'md': 3
+                        },
+                        'content': [
+                            {
+                                'component': 'VTextField',
+                                'props': {
+                                    'model': 'cron',
+                                    'label': '延迟上传（分钟）',
+                                    'placeholder': '20',
+                                    'variant': 'outlined',
+                                    'type': 'number',
+                                    'hide-details': True
+                                }
+                            }
+                        ]
+                    }
+                ]
+            },
 
-    # 统计和监控配置
-    _enable_statistics = True
+            # 基本路径配置
+            {
+                'component': 'VRow',
+                'props': {
+                    'class': 'mb-4'
+                },
+                'content': [
+                    {
+                        'component': 'VCol',
+                        'props': {
+                            'cols': 12,
+                            'md': 6
+                        },
+                        'content': [
+                            {
+                                'component': 'VTextField',
+                                'props': {
+                                    'model': 'softlink_prefix_path',
+                                    'label': '本地软链接路径前缀',
+                                    'placeholder': '/strm/',
+                                    'variant': 'outlined',
+                                    'hide-details': True,
+                                    'prepend-inner-icon': 'mdi-folder-open'
+                                }
+                            }
+                        ]
+                    },
+                    {
+                        'component': 'VCol',
+                        'props': {
+                            'cols': 12,
+                            'md': 6
+                        },
+                        'content': [
+                            {
+                                'component': 'VTextField',
+                                'props': {
+                                    'model': 'cd_mount_prefix_path',
+                                    'label': 'CloudDrive2挂载路径前缀',
+                                    'placeholder': '/CloudNAS/115/emby/',
+                                    'variant': 'outlined',
+                                    'hide-details': True,
+                                    'prepend-inner-icon': 'mdi-cloud'
+                                }
+                            }
+                        ]
+                    }
+                ]
+            },
+
+            # 配置面板组
+            {
+                'component': 'VExpansionPanels',
+                'props': {
+                    'multiple': True,
+                    'variant': 'accordion',
+                    'class': 'enterprise-panels'
+                },
+                'content': [
+                    # 监控配置
+                    {
+                        'component': 'VExpansionPanel',
+                        'props': {
+                            'value': 'monitoring'
+                        },
+                        'content': [
+                            {
+                                'component': 'VExpansionPanelTitle',
+                                'content': [
+                                    {
+                                        'component': 'div',
+                                        'props': {
+                                            'class': 'd-flex align-center'
+                                        },
+                                        'content': [
+                                            {
+                                                'component': 'VIcon',
+                                                'props': {
+                                                    'icon': 'mdi-monitor',
+                                                    'class': 'me-3',
+                                                    'color': 'info'
+                                                }
+                                            },
+                                            {
+                                                'component': 'span',
+                                                'props': {
+                                                    'class': 'text-h6'
+                                                },
+                                                'text': '监控配置'
+                                            }
+                                        ]
+                                    }
+                                ]
+                            },
+                            {
+                                'component': 'VExpansionPanelText',
+                                'content': [
+                                    {
+                                        'component': 'VRow',
+                                        'content': [
+                                            {
+                                                'component': 'VCol',
+                                                'props': {'cols': 12, 'md': 4},
+                                                'content': [{
+                                                    'component': 'VSwitch',
+                                                    'props': {
+                                                        'model': 'monitor_upload',
+                                                        'label': '开启上传监控',
+                                                        'color': 'success',
+                                                        'hide-details': True
+                                                    }
+                                                }]
+                                            },
+                                            {
+                                                'component': 'VCol',
+                                                'props': {'cols': 12, 'md': 4},
+                                                'content': [{
+                                                    'component': 'VSwitch',
+                                                    'props': {
+                                                        'model': 'notify_upload',
+                                                        'label': '上传通知',
+                                                        'color': 'warning',
+                                                        'hide-details': True
+                                                    }
+                                                }]
+                                            },
+                                            {
+                                                'component': 'VCol',
+                                                'props': {'cols': 12, 'md': 4},
+                                                'content': [{
+                                                    'component': 'VSwitch',
+                                                    'props': {
+                                                        'model': 'enable_favorite_notify',
+                                                        'label': '收藏通知',
+                                                        'color': 'error',
+                                                        'hide-details': True
+                                                    }
+                                                }]
+                                            }
+                                        ]
+                                    },
+                                    {
+                                        'component': 'VRow',
+                                        'content': [
+                                            {
+                                                'component': 'VCol',
+                                                'props': {'cols': 12, 'md': 6},
+                                                'content': [{
+                                                    'component': 'VTextField',
+                                                    'props': {
+                                                        'model': 'monitor_interval',
+                                                        'label': '监控间隔（分钟）',
+                                                        'placeholder': '10',
+                                                        'variant': 'outlined',
+                                                        'type': 'number',
+                                                        'hide-details': True
+                                                    }
+                                                }]
+                                            },
+                                            {
+                                                'component': 'VCol',
+                                                'props': {'cols': 12, 'md': 6},
+                                                'content': [{
+                                                    'component': 'VTextField',
+                                                    'props': {
+                                                        'model': 'clean_interval',
+                                                        'label': '清理间隔（分钟）',
+                                                        'placeholder': '60',
+                                                        'variant': 'outlined',
+                                                        'type': 'number',
+                                                        'hide-details': True
+                                                    }
+                                                }]
+                                            }
+                                        ]
+                                    }
+                                ]
+                            }
+                        ]
+                    },
+
+                    # 上传配置
+                    {
+                        'component': 'VExpansionPanel',
+                        'props': {
+                            'value': 'upload'
+                        },
+                        'content': [
+                            {
+                                'component': 'VExpansionPanelTitle',
+                                'content': [
+                                    {
+                                        'component': 'div',
+                                        'props': {
+                                            'class': 'd-flex align-center'
+                                        },
+                                        'content': [
+                                            {
+                                                'component': 'VIcon',
+                                                'props': {
+                                                    'icon': 'mdi-upload',
+                                                    'class': 'me-3',
+                                                    'color': 'success'
+                                                }
+                                            },
+                                            {
+                                                'component': 'span',
+                                                'props': {
+                                                    'class': 'text-h6'
+                                                },
+                                                'text': '上传配置'
+                                            }
+                                        ]
+                                    }
+                                ]
+                            },
+                            {
+                                'component': 'VExpansionPanelText',
+                                'content': [
+                                    {
+                                        'component': 'VRow',
+                                        'content': [
+                                            {
+                                                'component': 'VCol',
+                                                'props': {'cols': 12, 'md': 3},
+                                                'content': [{
+                                                    'component': 'VTextField',
+                                                    'props': {
+                                                        'model': 'upload_timeout',
+                                                        'label': '上传超时（分钟）',
+                                                        'placeholder': '60',
+                                                        'variant': 'outlined',
+                                                        'type': 'number',
+                                                        'hide-details': True
+                                                    }
+                                                }]
+                                            },
+                                            {
+                                                'component': 'VCol',
+                                                'props': {'cols': 12, 'md': 3},
+                                                'content': [{
+                                                    'component': 'VTextField',
+                                                    'props': {
+                                                        'model': 'upload_retry_count',
+                                                        'label': '重试次数',
+                                                        'placeholder': '3',
+                                                        'variant': 'outlined',
+                                                        'type': 'number',
+                                                        'hide-details': True
+                                                    }
+                                                }]
+                                            },
+                                            {
+                                                'component': 'VCol',
+                                                'props': {'cols': 12, 'md': 3},
+                                                'content': [{
+                                                    'component': 'VSwitch',
+                                                    'props': {
+                                                        'model': 'delete_source_after_upload',
+                                                        'label': '删除源文件',
+                                                        'color': 'error',
+                                                        'hide-details': True
+                                                    }
+                                                }]
+                                            },
+                                            {
+                                                'component': 'VCol',
+                                                'props': {'cols': 12, 'md': 3},
+                                                'content': [{
+                                                    'component': 'VSwitch',
+                                                    'props': {
+                                                        'model': 'enable_cookie_check',
+                                                        'label': 'Cookie检测',
+                                                        'color': 'warning',
+                                                        'hide-details': True
+                                                    }
+                                                }]
+                                            }
+                                        ]
+                                    }
+                                ]
+                            }
+                        ]
+                    },
+
+                    # 企业级功能
+                    {
+                        'component': 'VExpansionPanel',
+                        'props': {
+                            'value': 'enterprise'
+                        },
+                        'content': [
+                            {
+                                'component': 'VExpansionPanelTitle',
+                                'content': [
+                                    {
+                                        'component': 'div',
+                                        'props': {
+                                            'class': 'd-flex align-center'
+                                        },
+                                        'content': [
+                                            {
+                                                'component': 'VIcon',
+                                                'props': {
+                                                    'icon': 'mdi-crown',
+                                                    'class': 'me-3',
+                                                    'color': 'warning'
+                                                }
+                                            },
+                                            {
+                                                'component': 'span',
+                                                'props': {
+                                                    'class': 'text-h6'
+                                                },
+                                                'text': '企业级功能'
+                                            },
+                                            {
+                                                'component': 'VChip',
+                                                'props': {
+                                                    'size': 'small',
+                                                    'color': 'warning',
+                                                    'variant': 'flat',
+                                                    'class': 'ms-3'
+                                                },
+                                                'content': [
+                                                    {
+                                                        'component': 'span',
+                                                        'text': 'Enterprise'
+                                                    }
+                                                ]
+                                            }
+                                        ]
+                                    }
+                                ]
+                            },
+                            {
+                                'component': 'VExpansionPanelText',
+                                'content': [
+                                    {
+                                        'component': 'VRow',
+                                        'content': [
+                                            {
+                                                'component': 'VCol',
+                                                'props': {'cols': 12, 'md': 4},
+                                                'content': [{
+                                                    'component': 'VSwitch',
+                                                    'props': {
+                                                        'model': 'enable_enterprise_logging',
+                                                        'label': '企业级日志',
+                                                        'color': 'primary',
+                                                        'hide-details': True
+                                                    }
+                                                }]
+                                            },
+                                            {
+                                                'component': 'VCol',
+                                                'props': {'cols': 12, 'md': 4},
+                                                'content': [{
+                                                    'component': 'VSwitch',
+                                                    'props': {
+                                                        'model': 'enable_distributed_lock',
+                                                        'label': '分布式锁',
+                                                        'color': 'success',
+                                                        'hide-details': True
+                                                    }
+                                                }]
+                                            },
+                                            {
+                                                'component': 'VCol',
+                                                'props': {'cols': 12, 'md': 4},
+                                                'content': [{
+                                                    'component': 'VSwitch',
+                                                    'props': {
+                                                        'model': 'enable_health_check',
+                                                        'label': '健康检查',
+                                                        'color': 'info',
+                                                        'hide-details': True
+                                                    }
+                                                }]
+                                            }
+                                        ]
+                                    },
+                                    {
+                                        'component': 'VRow',
+                                        'content': [
+                                            {
+                                                'component': 'VCol',
+                                                'props': {'cols': 12, 'md': 4},
+                                                'content': [{
+                                                    'component': 'VSwitch',
+                                                    'props': {
+                                                        'model': 'enable_quota_management',
+                                                        'label': '配额管理',
+                                                        'color': 'warning',
+                                                        'hide-details': True
+                                                    }
+                                                }]
+                                            },
+                                            {
+                                                'component': 'VCol',
+                                                'props': {'cols': 12, 'md': 4},
+                                                'content': [{
+                                                    'component': 'VSwitch',
+                                                    'props': {
+                                                        'model': 'enable_api_handler',
+                                                        'label': 'REST API',
+                                                        'color': 'error',
+                                                        'hide-details': True
+                                                    }
+                                                }]
+                                            },
+                                            {
+                                                'component': 'VCol',
+                                                'props': {'cols': 12, 'md': 4},
+                                                'content': [{
+                                                    'component': 'VSwitch',
+                                                    'props': {
+                                                        'model': 'enable_webhook_manager',
+                                                        'label': 'WebHook',
+                                                        'color': 'deep-purple',
+                                                        'hide-details': True
+                                                    }
+                                                }]
+                                            }
+                                        ]
+                                    }
+                                ]
+                            }
+                        ]
+                    },
+
+                    # 高级配置
+                    {
+                        'component': 'VExpansionPanel',
+                        'props': {
+                            'value': 'advanced'
+                        },
+                        'content': [
+                            {
+                                'component': 'VExpansionPanelTitle',
+                                'content': [
+                                    {
+                                        'component': 'div',
+                                        'props': {
+                                            'class': 'd-flex align-center'
+                                        },
+                                        'content': [
+                                            {
+                                                'component': 'VIcon',
+                                                'props': {
+                                                    'icon': 'mdi-cogs',
+                                                    'class': 'me-3',
+                                                    'color': 'deep-purple'
+                                                }
+                                            },
+                                            {
+                                                'component': 'span',
+                                                'props': {
+                                                    'class': 'text-h6'
+                                                },
+                                                'text': '高级配置'
+                                            }
+                                        ]
+                                    }
+                                ]
+                            },
+                            {
+                                'component': 'VExpansionPanelText',
+                                'content': [
+                                    {
+                                        'component': 'VRow',
+                                        'content': [
+                                            {
+                                                'component': 'VCol',
+                                                'props': {'cols': 12, 'md': 6},
+                                                'content': [{
+                                                    'component': 'VTextarea',
+                                                    'props': {
+                                                        'model': 'cd2_confs',
+                                                        'label': 'CloudDrive2配置',
+                                                        'placeholder': 'host: http://ip:19798\nusername: admin\npassword: passwd\nsavepath: /home/media\nuploadpath: CD2Upload\nrootpath: 115\n\n---\n#组2配置...',
+                                                        'variant': 'outlined',
+                                                        'rows': 6,
+                                                        'hide-details': True
+                                                    }
+                                                }]
+                                            },
+                                            {
+                                                'component': 'VCol',
+                                                'props': {'cols': 12, 'md': 6},
+                                                'content': [{
+                                                    'component': 'VTextarea',
+                                                    'props': {
+                                                        'model': 'black_dirs',
+                                                        'label': '过滤目录',
+                                                        'placeholder': '每行一个目录，支持正则表达式\n例如：\n.*\\.tmp$\n/temp/\n.*test.*',
+                                                        'variant': 'outlined',
+                                                        'rows': 6,
+                                                        'hide-details': True
+                                                    }
+                                                }]
+                                            }
+                                        ]
+                                    },
+                                    {
+                                        'component': 'VRow',
+                                        'content': [
+                                            {
+                                                'component': 'VCol',
+                                                'props': {'cols': 12},
+                                                'content': [{
+                                                    'component': 'VTextField',
+                                                    'props': {
+                                                        'model': 'cloud_media_sync',
+                                                        'label': 'Cloud Media Sync插件ID',
+                                                        'placeholder': '请在Cloud Media Sync插件中查看其Plugin ID',
+                                                        'variant': 'outlined',
+                                                        'hide-details': True,
+                                                        'prepend-inner-icon': 'mdi-link'
+                                                    }
+                                                }]
+                                            }
+                                        ]
+                                    }
+                                ]
+                            }
+                        ]
+                    }
+                ]
+            }
+        ]
+    }
+]
+
+# 配置页面数据结构：(配置项, 插件属性, 属性不存在时的默认值)
+_FORM_DEFAULT_ATTRS = (
+    ('enable', '_enable', None),
+    ('cron', '_cron', None),
+    ('onlyonce', '_onlyonce', None),
+    ('cleanlink', '_cleanlink', None),
+    ('monitor_upload', '_monitor_upload', None),
+    ('notify_upload', '_notify_upload', None),
+    ('upload_retry_count', '_upload_retry_count', None),
+    ('cd2_confs', '_cd2_confs', None),
+    ('cloud_media_sync', '_cloud_media_sync', None),
+    ('monitor_interval', '_monitor_interval', None),
+    ('clean_interval', '_clean_interval', None),
+    ('enable_cookie_check', '_enable_cookie_check', None),
+    ('cookie_check_interval', '_cookie_check_interval', None),
+    ('black_dirs', '_black_dirs', None),
+    ('upload_timeout', '_upload_timeout', None),
+    ('delete_source_after_upload', '_delete_source_after_upload', None),
+    ('enable_favorite_notify', '_enable_favorite_notify', None),
+    ('softlink_prefix_path', '_softlink_prefix_path', None),
+    ('cd_mount_prefix_path', '_cd_mount_prefix_path', None),
+    # 企业级配置项
+    ('enable_enterprise_logging', '_enable_enterprise_logging', True),
+    ('enable_distributed_lock', '_enable_distributed_lock', True),
+    ('enable_health_check', '_enable_health_check', True),
+    ('enable_quota_management', '_enable_quota_management', True),
+    ('enable_api_handler', '_enable_api_handler', True),
+    ('enable_webhook_manager', '_enable_webhook_manager', True),
+)
+
+# 数值型配置项：(插件属性, 默认值, 类型)，加载配置时统一转换一次
+_NUMERIC_CONFIG = (
+    ('_cron', 20, int),
+    ('_upload_retry_count', 3, int),
+    ('_monitor_interval', 10, int),
+    ('_clean_interval', 20, int),
+    ('_cookie_check_interval', 30, int),
+    ('_upload_timeout', 300, int),
+    ('_max_concurrent_uploads', 3, int),
+    ('_queue_check_interval', 5, int),
+    ('_max_retry_attempts', 5, int),
+    ('_retry_base_delay', 2, float),
+    ('_retry_max_delay', 300, float),
+    ('_stats_cleanup_days', 30, int),
+    ('_log_retention_days', 30, int),
+    ('_quota_upload_limit', 1000, int),
+    ('_quota_window_hours', 24, int),
+    ('_api_timeout', 30, int),
+)
+
+
+def _to_number(value, cast=int):
+    """配置数值转换，前端输入框可能提交字符串或空值，无效时返回None"""
+    try:
+        return cast(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class Cd2Upload(_PluginBase):
+    # 插件名称
+    plugin_name = "CloudDrive2智能上传"
+    # 插件描述
+    plugin_desc = "智能上传媒体文件到CloudDrive2，支持上传监控、任务管理、通知Cloud Media Sync处理后续文件管理"
+    # 插件图标
+    plugin_icon = "https://raw.githubusercontent.com/thsrite/MoviePilot-Plugins/main/icons/clouddrive.png"
+    # 插件版本
+    plugin_version = "2.2.0"
+    # 插件作者
+    plugin_author = "honue & enhanced"
+    # 作者主页
+    author_url = "https://github.com/honue"
+    # 插件配置项ID前缀
+    plugin_config_prefix = "cd2upload_"
+    # 加载顺序
+    plugin_order = 1
+    # 可使用的用户级别
+    auth_level = 1
+
+    _enable = True
+    _cron = '20'
+    _onlyonce = False
+    _cleanlink = False
+    _monitor_upload = True
+    _notify_upload = False
+    _upload_retry_count = 3
+    _cd2_confs = None
+    _cloud_media_sync = True
+    _monitor_interval = 10
+    _clean_interval = 20
+    _enable_cookie_check = True
+    _cookie_check_interval = 30
+    _black_dirs = ""
+    _black_dir_set = frozenset()
+    _upload_timeout = 300
+    _delete_source_after_upload = False
+    _enable_favorite_notify = True
+    _notification_type = "Plugin"
+    _notification_channels = ""
+    _notification_channel_list = ()
+    _notification_mtype = NotificationType.Plugin
+    # Cloud Media Sync 插件运行状态缓存
+    _cms_running = True
+    _cms_checked_at = 0.0
+    _enable_progress_notify = False
+    _enable_detailed_stats = True
+
+    # 上传队列管理配置
+    _enable_queue_management = True
+    _max_concurrent_uploads = 3
+    _queue_check_interval = 5
+
+    # 增强错误处理配置
+    _enable_smart_retry = True
+    _max_retry_attempts = 5
+    _retry_base_delay = 2
+    _retry_max_delay = 300
+    _enable_jitter = True
+    _retry_policy = RetryPolicy()
+
+    # 统计和监控配置
+    _enable_statistics = True
     _stats_cleanup_days = 30
     _enable_performance_monitoring = True
 
@@ -1101,10 +2114,19 @@ class Cd2Upload(_PluginBase):
     _cd_mount_prefix_path = '/CloudNAS/115/emby/'
 
     _scheduler = None
+    _tz = None
     _cd2_clients = {}
-    _clients = {}
     _cd2_url = {}
     _upload_queue = None
+    _upload_executor = None
+    _notify_executor = None
+    # 通知发送队列及后台线程，事件处理线程只负责入队
+    _notify_queue = None
+    _notify_thread = None
+    # 收藏事件媒体识别缓存 {tmdb_id: (识别时间, MediaInfo)}
+    _media_cache = OrderedDict()
+    _media_cache_ttl = 3600
+    _media_cache_size = 256
     _statistics = None
     _enterprise_logger = None
     _quota_manager = None
@@ -1112,20 +2134,33 @@ class Cd2Upload(_PluginBase):
     _api_handler = None
     _webhook_manager = None
 
+    # 新入库文件的内存暂存区，由定时任务批量写入waiting_process_list
+    _pending_waiting = deque()
+    _pending_lock = threading.Lock()
+    # 队列上传成功的文件暂存区（dict作有序集合去重），延迟批量写入processed_list/waiting_process_list
+    _uploaded_buffer = {}
+    _uploaded_flush_timer = None
+    # 收藏剧集（内存常驻），变更后延迟写入
+    _favor = None
+    _favor_lock = threading.Lock()
+    _favor_dirty = False
+    _favor_flush_timer = None
+    # 上传历史（JSONL追加写入），行数超过上限时截断保留最近记录
+    _history_lock = threading.Lock()
+    _history_lines = None
+    _history_keep = 100
+    _history_max_lines = 150
+    # 统计接口结果缓存 {方法名: (时间, 结果)}
+    _api_cache = {}
+
     _subscribe_oper = SubscribeOper()
 
     def init_plugin(self, config: dict = None):
-        # 检查版本兼容性
-        try:
-            if hasattr(settings, 'VERSION_FLAG'):
-                version = settings.VERSION_FLAG  # V2
-                logger.info("检测到MoviePilot V2版本")
-            else:
-                version = "v1"
-                logger.info("检测到MoviePilot V1版本")
-        except Exception as e:
-            logger.warning(f"版本检测失败: {e}")
-            version = "unknown"
+        # 检查版本兼容性（V2 设置中带有 VERSION_FLAG）
+        if hasattr(settings, 'VERSION_FLAG'):
+            logger.info("检测到MoviePilot V2版本")
+        else:
+            logger.info("检测到MoviePilot V1版本")
 
         # 检查 clouddrive 依赖是否可用
         if not CLOUDDRIVE_AVAILABLE:
@@ -1136,7 +2171,7 @@ class Cd2Upload(_PluginBase):
 
         if config:
             self._enable = config.get('enable', False)
-            self._cron: int = int(config.get('cron', '20'))
+            self._cron = config.get('cron', '20')
             self._onlyonce = config.get('onlyonce', False)
             self._cleanlink = config.get('cleanlink', False)
             self._monitor_upload = config.get('monitor_upload', True)
@@ -1181,28 +2216,77 @@ class Cd2Upload(_PluginBase):
             self._softlink_prefix_path = config.get('softlink_prefix_path', '/strm/')
             self._cd_mount_prefix_path = config.get('cd_mount_prefix_path', '/CloudNAS/CloudDrive/115/emby/')
 
+        # 数值配置在此统一校验转换，运行时各处直接使用，无需再做类型转换或异常处理
+        for attr, default, cast in _NUMERIC_CONFIG:
+            value = getattr(self, attr)
+            number = _to_number(value, cast)
+            if number is None:
+                # 未填写时静默使用默认值，填写了无效值才提示
+                if value not in (None, ""):
+                    logger.warning(f"配置项 {attr.lstrip('_')} 的值 {value!r} 无效，使用默认值 {default}")
+                number = default
+            setattr(self, attr, number)
+
         self.stop_service()
 
+        self._retry_policy = RetryPolicy(
+            max_attempts=self._max_retry_attempts if self._enable_smart_retry else self._upload_retry_count,
+            base_delay=self._retry_base_delay,
+            max_delay=self._retry_max_delay,
+            enable_jitter=self._enable_jitter,
+            smart=self._enable_smart_retry
+        )
+        self._media_cache = OrderedDict()
+        # 旧实例暂存的新入库文件已在stop_service中写入，新实例使用独立的暂存区
+        self._pending_waiting = deque()
+        self._favor = None
+        # 逗号分隔的配置项预先拆分，避免每次检查/通知时重复解析
+        self._black_dir_set = frozenset(d.strip() for d in (self._black_dirs or "").split(",") if d.strip())
+        self._notification_channel_list = tuple(
+            ch.strip() for ch in (self._notification_channels or "").split(",") if ch.strip())
+        self._notification_mtype = NotificationType.__members__.get(self._notification_type or "",
+                                                                    NotificationType.Plugin)
+        # 配置可能更换了Cloud Media Sync插件ID，重新检测运行状态
+        self._cms_running = True
+        self._cms_checked_at = 0.0
+
         if not self._enable:
             return
 
         # 初始化CloudDrive2客户端
         self._cd2_clients = {}
-        self._clients = {}
         self._cd2_url = {}
 
         if self._cd2_confs:
             self._setup_cd2_clients()
 
+        # 多个通知渠道时并发发送
+        if len(self._notification_channel_list) > 1:
+            self._notify_executor = ThreadPoolExecutor(max_workers=min(len(self._notification_channel_list), 8),
+                                                       thread_name_prefix="cd2upload-notify")
+        self._notify_queue = Queue(maxsize=1000)
+        self._notify_thread = threading.Thread(target=self._notify_worker, args=(self._notify_queue,),
+                                               name="cd2upload-notify-queue", daemon=True)
+        self._notify_thread.start()
+
         # 初始化上传队列
         if self._enable_queue_management:
             self._upload_queue = UploadQueue(max_concurrent_uploads=self._max_concurrent_uploads)
+            # 常驻线程池执行队列任务，避免每个任务新建线程
+            self._upload_executor = ThreadPoolExecutor(max_workers=max(1, self._max_concurrent_uploads),
+                                                       thread_name_prefix="cd2upload-queue")
             logger.info(f"上传队列初始化完成，最大并发数: {self._max_concurrent_uploads}")
+        else:
+            # 直接上传同样复用常驻线程池，线程数限制在1~8之间，避免过多并发拖垮挂载盘
+            self._upload_executor = ThreadPoolExecutor(
+                max_workers=max(1, min(self._max_concurrent_uploads, 8)),
+                thread_name_prefix="cd2upload")
 
         # 初始化统计管理器
         if self._enable_statistics:
             self._statistics = UploadStatistics()
             logger.info("统计管理器初始化完成")
+        self._api_cache = {}
 
         # 初始化企业级日志系统
         if self._enable_enterprise_logging:
@@ -1239,7 +2323,8 @@ class Cd2Upload(_PluginBase):
             logger.info("WebHook管理器初始化完成")
 
         # 补全历史文件
-        file_num = int(os.getenv('FULL_RECENT', '0')) if os.getenv('FULL_RECENT', '0').isdigit() else 0
+        full_recent = os.getenv('FULL_RECENT', '0')
+        file_num = int(full_recent) if full_recent.isdigit() else 0
         if file_num:
             recent_files = [transfer_history.dest for transfer_history in
                             TransferHistory.list_by_page(count=file_num, db=get_db())]
@@ -1249,20 +2334,29 @@ class Cd2Upload(_PluginBase):
                 waiting_process_list = waiting_process_list + recent_files
                 self.save_data('waiting_process_list', waiting_process_list)
 
+        # 延迟导入调度相关模块，插件未启用时不加载
+        import pytz
+        from apscheduler.schedulers.background import BackgroundScheduler
+
         # 初始化调度器
+        self._tz = pytz.timezone(settings.TZ)
         self._scheduler = BackgroundScheduler(timezone=settings.TZ)
 
         if self._onlyonce:
             self._scheduler.add_job(func=self.task, trigger='date',
-                                    run_date=datetime.now(tz=pytz.timezone(settings.TZ)) + timedelta(seconds=10),
+                                    run_date=datetime.now(tz=self._tz) + timedelta(seconds=10),
                                     name="CloudDrive2智能上传")
             logger.info("CloudDrive2智能上传，立即运行一次")
 
         if self._cleanlink:
             self._scheduler.add_job(func=self.clean, kwargs={"cleanlink": True}, trigger='date',
-                                    run_date=datetime.now(tz=pytz.timezone(settings.TZ)) + timedelta(seconds=3),
+                                    run_date=datetime.now(tz=self._tz) + timedelta(seconds=3),
                                     name="清理无效软链接")
 
+        # 待转移列表批量写入任务
+        self._scheduler.add_job(func=self._flush_pending_waiting, trigger='interval',
+                                seconds=2, name="待转移列表写入")
+
         # 定期清理任务
         self._scheduler.add_job(func=self.clean, kwargs={"cleanlink": False}, trigger='interval',
                                 minutes=self._clean_interval, name="定期清理检查")
@@ -1356,16 +2450,15 @@ class Cd2Upload(_PluginBase):
 
     @eventmanager.register(EventType.TransferComplete)
     def update_waiting_list(self, event: Event):
-        transfer_info: TransferInfo = event.event_data.get('transferinfo', {})
-        if not transfer_info.file_list_new:
+        transfer_info: TransferInfo = event.event_data.get('transferinfo')
+        file_list_new = getattr(transfer_info, 'file_list_new', None)
+        if not file_list_new:
             return
-        with lock:
-            # 等待转移的文件的链接的完整路径
-            waiting_process_list = self.get_data('waiting_process_list') or []
-            waiting_process_list = waiting_process_list + transfer_info.file_list_new
-            self.save_data('waiting_process_list', waiting_process_list)
+        with self._pending_lock:
+            # 等待转移的文件的链接的完整路径，先暂存在内存中，由定时任务批量写入
+            self._pending_waiting.extend(file_list_new)
 
-        logger.info(f'新入库，加入待转移列表 {transfer_info.file_list_new}')
+        logger.info('新入库，加入待转移列表 %s', file_list_new)
 
         # 判断段转移任务开始时间 新剧晚点上传 老剧立马上传
         media_info: MediaInfo = event.event_data.get('mediainfo', {})
@@ -1378,22 +2471,43 @@ class Cd2Upload(_PluginBase):
                 if not self._scheduler.get_jobs():
                     logger.info(f'追更剧集,{self._cron}分钟后开始执行任务...')
                 try:
-                    self._scheduler.remove_all_jobs()
                     self._scheduler.add_job(func=self.task, trigger='date',
                                             kwargs={"media_info": media_info, "meta": meta},
-                                            run_date=datetime.now(tz=pytz.timezone(settings.TZ)) + timedelta(
-                                                minutes=self._cron),
+                                            run_date=datetime.now(tz=self._tz) + timedelta(minutes=self._cron),
+                                            id="cd2_transfer", replace_existing=True,
                                             name="cd2转移")
                 except Exception as err:
                     logger.error(f"定时任务配置错误：{str(err)}")
             else:
                 if not self._scheduler.get_jobs():
                     logger.info(f'已完结剧集,立即执行上传任务...')
-                self._scheduler.remove_all_jobs()
                 self._scheduler.add_job(func=self.task, trigger='date',
-                                        run_date=datetime.now(tz=pytz.timezone(settings.TZ)) + timedelta(seconds=5),
+                                        run_date=datetime.now(tz=self._tz) + timedelta(seconds=5),
+                                        id="cd2_transfer", replace_existing=True,
                                         name="cd2转移")
-            self._scheduler.start()
+            if not self._scheduler.running:
+                self._scheduler.start()
+
+    def _to_cd2_path(self, path: str) -> str:
+        """将本地软链接路径转换为CloudDrive2挂载路径"""
+        return _translate_path(path, self._softlink_prefix_path, self._cd_mount_prefix_path)
+
+    def _drain_pending_waiting(self) -> List[str]:
+        """取出内存中暂存的新入库文件"""
+        with self._pending_lock:
+            pending = list(self._pending_waiting)
+            self._pending_waiting.clear()
+        return pending
+
+    def _flush_pending_waiting(self):
+        """将暂存的新入库文件批量写入待转移列表"""
+        pending = self._drain_pending_waiting()
+        if not pending:
+            return
+        with lock:
+            waiting_process_list = self.get_data('waiting_process_list') or []
+            waiting_process_list.extend(pending)
+            self.save_data('waiting_process_list', waiting_process_list)
 
     def task(self, media_info: MediaInfo = None, meta: MetaBase = None):
         start_time = time.time()
@@ -1422,6 +2536,12 @@ class Cd2Upload(_PluginBase):
         try:
             waiting_process_list = self.get_data('waiting_process_list') or []
 
+            # 合并尚未写入的新入库文件
+            pending = self._drain_pending_waiting()
+            if pending:
+                waiting_process_list.extend(pending)
+                self.save_data('waiting_process_list', waiting_process_list)
+
             if not waiting_process_list:
                 logger.info('没有需要转移的媒体文件')
                 if self._enterprise_logger:
@@ -1446,7 +2566,7 @@ class Cd2Upload(_PluginBase):
                 return
 
             logger.info('开始执行智能上传任务，上传完成后将通知Cloud Media Sync处理')
-            logger.info(f'待上传文件列表: {waiting_process_list}')
+            logger.info('待上传文件列表: %s', waiting_process_list)
 
             # 记录性能指标
             if self._enterprise_logger:
@@ -1485,23 +2605,22 @@ class Cd2Upload(_PluginBase):
         priority = UploadPriority.NORMAL
         if media_info:
             # 检查是否为收藏剧集
-            favor_data = self.get_data('favor') or {}
+            favor_data = self._get_favor()
             tmdb_id = str(media_info.tmdb_id)
             if favor_data.get(tmdb_id) and media_info.type == MediaType.TV:
                 priority = UploadPriority.HIGH
                 logger.info(f"收藏剧集检测到，设置为高优先级: {media_info.title_year}")
 
         # 添加任务到队列
-        for file_path in file_list:
-            cd2_dest = file_path.replace(self._softlink_prefix_path, self._cd_mount_prefix_path)
-            task = UploadTask(
-                file_path=file_path,
-                cd2_dest=cd2_dest,
-                priority=priority,
-                media_info=media_info,
-                meta=meta
-            )
-            self._upload_queue.add_task(task)
+        to_cd2_path = self._to_cd2_path
+        tasks = [UploadTask(
+            file_path=file_path,
+            cd2_dest=to_cd2_path(file_path),
+            priority=priority,
+            media_info=media_info,
+            meta=meta
+        ) for file_path in file_list]
+        self._upload_queue.add_tasks_bulk(tasks)
 
         # 发送开始通知
         if self._enable_progress_notify:
@@ -1514,7 +2633,15 @@ class Cd2Upload(_PluginBase):
     def _process_upload_directly(self, waiting_process_list: List[str], media_info: MediaInfo = None,
                                  meta: MetaBase = None, start_time: float = None):
         """直接处理上传（传统方式）"""
+        # 复用插件初始化时创建的上传线程池
+        executor = self._upload_executor
+        if not executor:
+            logger.warning("上传线程池未初始化，插件可能已停止，跳过本次上传")
+            return
         processed_list = self.get_data('processed_list') or []
+        processed_set = set(processed_list)
+        # 使用集合记录未完成文件，避免列表逐个删除带来的平方复杂度
+        pending_set = set(waiting_process_list)
 
         # 初始化统计信息
         upload_stats = {
@@ -1532,20 +2659,27 @@ class Cd2Upload(_PluginBase):
                 text=f"开始上传 {upload_stats['total']} 个文件"
             )
 
-        process_list = waiting_process_list.copy()
-        for index, softlink_source in enumerate(waiting_process_list):
-            # 链接目录前缀 替换为 cd2挂载前缀
-            cd2_dest = softlink_source.replace(self._softlink_prefix_path, self._cd_mount_prefix_path)
-
-            # 记录当前进度
-            current_progress = index + 1
-            logger.info(f'【{current_progress}/{upload_stats["total"]}】处理文件: {softlink_source}')
+        to_cd2_path = self._to_cd2_path
+        # 链接目录前缀 替换为 cd2挂载前缀
+        try:
+            futures = [executor.submit(self._upload_one, softlink_source,
+                                       to_cd2_path(softlink_source))
+                       for softlink_source in waiting_process_list]
+        except RuntimeError:
+            # 提交期间插件停止或重载，线程池已关闭；待转移列表保持不变，下次任务继续处理
+            logger.warning("上传线程池已关闭，插件可能已停止，跳过本次上传")
+            return
 
-            if self._upload_file_with_retry(softlink_source=softlink_source, cd2_dest=cd2_dest):
-                process_list.remove(softlink_source)
-                processed_list.append(softlink_source)
+        # 按完成顺序汇总结果，统计与列表均只在当前线程中修改
+        for current_progress, future in enumerate(as_completed(futures), start=1):
+            softlink_source, success = future.result()
+            if success:
+                pending_set.discard(softlink_source)
+                if softlink_source not in processed_set:
+                    processed_set.add(softlink_source)
+                    processed_list.append(softlink_source)
                 upload_stats['success'] += 1
-                logger.info(f'【{current_progress}/{upload_stats["total"]}】上传成功: {softlink_source}')
+                logger.info('【%d/%d】上传成功: %s', current_progress, upload_stats["total"], softlink_source)
 
                 # 发送进度通知
                 if self._enable_progress_notify and current_progress % 5 == 0:  # 每5个文件通知一次
@@ -1556,8 +2690,7 @@ class Cd2Upload(_PluginBase):
             else:
                 upload_stats['failed'] += 1
                 upload_stats['failed_files'].append(softlink_source)
-                logger.error(f'【{current_progress}/{upload_stats["total"]}】上传失败: {softlink_source}')
-                continue
+                logger.error('【%d/%d】上传失败: %s', current_progress, upload_stats["total"], softlink_source)
 
         # 完成统计
         end_time = time.time()
@@ -1570,55 +2703,58 @@ class Cd2Upload(_PluginBase):
 
         logger.info(
             f"上传任务完成 - 成功: {upload_stats['success']}, 失败: {upload_stats['failed']}, 用时: {upload_stats['duration']}秒")
+        process_list = [file for file in waiting_process_list if file in pending_set]
         self.save_data('waiting_process_list', process_list)
         self.save_data('processed_list', processed_list)
 
         # 发送完成通知
         self._send_upload_completion_notification(upload_stats, media_info, meta)
 
+    def _upload_one(self, softlink_source: str, cd2_dest: str) -> Tuple[str, bool]:
+        """在线程池中上传单个文件"""
+        logger.info('处理文件: %s', softlink_source)
+        try:
+            return softlink_source, self._upload_file_with_retry(softlink_source=softlink_source, cd2_dest=cd2_dest)
+        except Exception as e:
+            logger.error(f"上传文件异常: {softlink_source}, 错误: {e}")
+            return softlink_source, False
+
     def _classify_error(self, error: Exception) -> ErrorType:
         """分类错误类型"""
-        error_str = str(error).lower()
-
-        if "permission" in error_str or "access" in error_str:
-            return ErrorType.PERMISSION_ERROR
-        elif "no space" in error_str or "disk full" in error_str:
-            return ErrorType.DISK_FULL
-        elif "not found" in error_str or "no such file" in error_str:
-            return ErrorType.FILE_NOT_FOUND
-        elif "network" in error_str or "timeout" in error_str or "connection" in error_str:
-            return ErrorType.NETWORK_ERROR
-        elif "temporary" in error_str or "busy" in error_str:
-            return ErrorType.TEMPORARY_ERROR
-        else:
-            return ErrorType.UNKNOWN_ERROR
+        # 单次扫描合并后的正则，命中最高优先级分组时提前结束
+        best_rank, best_type = len(_ERROR_PRIORITY), ErrorType.UNKNOWN_ERROR
+        for m in _ERROR_PATTERN.finditer(str(error)):
+            rank, error_type = _ERROR_RANK[m.lastgroup]
+            if rank < best_rank:
+                if rank == 0:
+                    return error_type
+                best_rank, best_type = rank, error_type
+        return best_type
 
     def _is_retryable_error(self, error_type: ErrorType) -> bool:
         """判断错误是否可重试"""
-        non_retryable = {ErrorType.PERMISSION_ERROR, ErrorType.FILE_NOT_FOUND}
-        return error_type not in non_retryable
+        return error_type not in _NON_RETRYABLE_ERRORS
 
-    def _calculate_retry_delay(self, attempt: int) -> float:
+    def _calculate_retry_delay(self, attempt: int, prev_delay: float = None) -> float:
         """计算重试延迟时间（智能退避算法）"""
-        if not self._enable_smart_retry:
+        policy = self._retry_policy
+        if not policy.smart:
             return 2 ** attempt  # 简单指数退避
 
-        base_delay = self._retry_base_delay
-        max_delay = self._retry_max_delay
-
-        # 指数退避
-        delay = min(base_delay * (2 ** attempt), max_delay)
+        base_delay = policy.base_delay
+        max_delay = policy.max_delay
 
-        # 添加抖动
-        if self._enable_jitter:
-            jitter = random.uniform(0, delay * 0.1)
-            delay += jitter
+        # 去相关抖动：在 [base, 上次延迟*3] 内随机取值
+        if policy.enable_jitter:
+            return min(max_delay, _rng().uniform(base_delay, (prev_delay or base_delay) * 3))
 
-        return delay
+        # 指数退避
+        return min(base_delay * (2 ** attempt), max_delay)
 
     def _upload_file_with_retry(self, softlink_source: str = None, cd2_dest: str = None) -> bool:
         """带智能重试机制的文件上传"""
-        max_attempts = self._max_retry_attempts if self._enable_smart_retry else self._upload_retry_count
+        max_attempts = self._retry_policy.max_attempts
+        delay = None
 
         for attempt in range(max_attempts):
             try:
@@ -1629,7 +2765,7 @@ class Cd2Upload(_PluginBase):
 
                 # 如果不是最后一次尝试，等待后重试
                 if attempt < max_attempts - 1:
-                    delay = self._calculate_retry_delay(attempt)
+                    delay = self._calculate_retry_delay(attempt, delay)
                     logger.info(f"等待 {delay:.1f} 秒后重试")
                     time.sleep(delay)
 
@@ -1644,11 +2780,10 @@ class Cd2Upload(_PluginBase):
 
                 # 如果不是最后一次尝试，等待后重试
                 if attempt < max_attempts - 1:
-                    delay = self._calculate_retry_delay(attempt)
-
-                    # 对于磁盘满错误，使用更长的延迟
+                    delay = self._calculate_retry_delay(attempt, delay)
+                    # 对于磁盘满错误，延长等待时间（上限同样放宽3倍）
                     if error_type == ErrorType.DISK_FULL:
-                        delay *= 3
+                        delay = min(self._retry_policy.max_delay * 3, delay * 3)
                         logger.warning(f"磁盘空间不足，延长等待时间到 {delay:.1f} 秒")
 
                     logger.info(f"等待 {delay:.1f} 秒后重试")
@@ -1662,11 +2797,21 @@ class Cd2Upload(_PluginBase):
         start_time = time.time()
 
         try:
-            # 获取文件大小用于统计
-            if os.path.exists(softlink_source):
-                real_source = os.readlink(softlink_source) if os.path.islink(softlink_source) else softlink_source
-                if os.path.exists(real_source):
-                    file_size = os.path.getsize(real_source)
+            # 获取文件大小用于统计，一次lstat判断链接，链接目标只stat一次
+            real_source = None
+            try:
+                link_st = os.lstat(softlink_source)
+            except FileNotFoundError:
+                link_st = None
+            if link_st is not None:
+                if stat.S_ISLNK(link_st.st_mode):
+                    real_source = os.readlink(softlink_source)
+                    try:
+                        file_size = os.stat(softlink_source).st_size
+                    except FileNotFoundError:
+                        pass
+                else:
+                    file_size = link_st.st_size
 
             # 记录上传尝试
             if self._statistics:
@@ -1674,14 +2819,23 @@ class Cd2Upload(_PluginBase):
 
             cd2_dest_folder, cd2_dest_file_name = os.path.split(cd2_dest)
 
-            if not os.path.exists(cd2_dest_folder):
-                os.makedirs(cd2_dest_folder)
-                logger.info(f'创建文件夹 {cd2_dest_folder}')
+            if not os.path.isdir(cd2_dest_folder):
+                # 并发上传同一目录时可能已被其他线程创建
+                os.makedirs(cd2_dest_folder, exist_ok=True)
+                logger.info('创建文件夹 %s', cd2_dest_folder)
 
-            real_source = os.readlink(softlink_source)
-            logger.debug(f'源文件路径 {real_source}')
+            if real_source is None:
+                # 非软链接时与原逻辑一致，由readlink抛出异常
+                real_source = os.readlink(softlink_source)
+            logger.debug('源文件路径 %s', real_source)
 
-            if not os.path.exists(cd2_dest):
+            try:
+                os.lstat(cd2_dest)
+                dest_exists = True
+            except FileNotFoundError:
+                dest_exists = False
+
+            if not dest_exists:
                 # 将文件上传到当前文件夹 同步
                 shutil.copy2(softlink_source, cd2_dest, follow_symlinks=True)
 
@@ -1689,11 +2843,11 @@ class Cd2Upload(_PluginBase):
                 if self._delete_source_after_upload:
                     try:
                         os.remove(real_source)
-                        logger.info(f"已删除源文件: {real_source}")
+                        logger.info("已删除源文件: %s", real_source)
                     except Exception as e:
                         logger.error(f"删除源文件失败: {e}")
             else:
-                logger.info(f'{cd2_dest_file_name} 已存在 {cd2_dest}')
+                logger.info('%s 已存在 %s', cd2_dest_file_name, cd2_dest)
 
             # 记录成功结果
             duration = time.time() - start_time
@@ -1713,8 +2867,8 @@ class Cd2Upload(_PluginBase):
         except Exception as e:
             # 记录失败结果
             duration = time.time() - start_time
+            error_type = self._classify_error(e).value if self._statistics or self._webhook_manager else None
             if self._statistics:
-                error_type = self._classify_error(e).value
                 self._statistics.record_upload_result(softlink_source, False, duration, file_size, error_type)
 
             # 触发WebHook事件
@@ -1723,7 +2877,7 @@ class Cd2Upload(_PluginBase):
                     "file_path": softlink_source,
                     "cd2_dest": cd2_dest,
                     "error": str(e),
-                    "error_type": self._classify_error(e).value,
+                    "error_type": error_type,
                     "duration": duration
                 })
 
@@ -1732,8 +2886,6 @@ class Cd2Upload(_PluginBase):
 
     def _save_upload_stats(self, stats: Dict, media_info: MediaInfo = None, meta: MetaBase = None):
         """保存上传统计数据"""
-        upload_history = self.get_data('upload_history') or []
-
         upload_record = {
             'timestamp': datetime.now().isoformat(),
             'total_files': stats['total'],
@@ -1745,13 +2897,51 @@ class Cd2Upload(_PluginBase):
             'media_type': media_info.type.value if media_info else "unknown"
         }
 
-        upload_history.append(upload_record)
+        history_path = self._history_path()
+        with self._history_lock:
+            if self._history_lines is None:
+                self._history_lines = self._init_history_file(history_path)
+
+            # 追加写入一行，无需读取和重写全部历史
+            with open(history_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(upload_record, ensure_ascii=False) + '\n')
+            self._history_lines += 1
 
-        # 只保留最近100条记录
-        if len(upload_history) > 100:
-            upload_history = upload_history[-100:]
+            # 超过上限时只保留最近100条记录
+            if self._history_lines > self._history_max_lines:
+                self._history_lines = self._trim_history_file(history_path, self._history_keep)
 
-        self.save_data('upload_history', upload_history)
+    def _history_path(self) -> Path:
+        """上传历史文件路径"""
+        return self.get_data_path() / 'upload_history.jsonl'
+
+    def _init_history_file(self, history_path: Path) -> int:
+        """统计历史文件行数，首次使用时迁移旧版保存在插件数据中的记录"""
+        try:
+            with open(history_path, 'r', encoding='utf-8') as f:
+                return sum(1 for _ in f)
+        except FileNotFoundError:
+            pass
+
+        legacy_history = self.get_data('upload_history') or []
+        with open(history_path, 'w', encoding='utf-8') as f:
+            for record in legacy_history:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        if legacy_history:
+            # 迁移完成后删除旧数据，避免插件数据中长期残留
+            self.del_data('upload_history')
+        return len(legacy_history)
+
+    @staticmethod
+    def _trim_history_file(history_path: Path, keep: int) -> int:
+        """截断历史文件，仅保留最后keep行，原子替换"""
+        with open(history_path, 'r', encoding='utf-8') as f:
+            lines = deque(f, maxlen=keep)
+        tmp_path = history_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+        os.replace(tmp_path, history_path)
+        return len(lines)
 
     def _send_upload_completion_notification(self, stats: Dict, media_info: MediaInfo = None, meta: MetaBase = None):
         """发送上传完成通知"""
@@ -1764,7 +2954,7 @@ class Cd2Upload(_PluginBase):
 
         # 如果是收藏的剧集，添加额外信息
         if media_info:
-            favor_data = self.get_data('favor') or {}
+            favor_data = self._get_favor()
             tmdb_id = str(media_info.tmdb_id)
 
             if favor_data.get(tmdb_id) and media_info.type == MediaType.TV:
@@ -1782,49 +2972,58 @@ class Cd2Upload(_PluginBase):
         self._send_notification(title=title, text=text)
 
     def clean(self, cleanlink: bool = False):
+        # 先写入暂存的成功记录，保证清理基于最新的processed_list
+        self._flush_uploaded_buffer()
         with lock:
             waiting_process_list = self.get_data('processed_list') or []
-            processed_list = waiting_process_list.copy()
-            logger.info(f"已处理列表：{processed_list}")
-            logger.debug(f"cleanlink {cleanlink}")
+            processed_list = []
+            logger.info("已处理列表：%s", waiting_process_list)
+            logger.debug("cleanlink %s", cleanlink)
 
             for file in waiting_process_list:
-                if not os.path.islink(file):
-                    processed_list.remove(file)
-                    logger.info(f"软链接符号不存在 {file}")
+                # 一次lstat判断是否为软链接
+                try:
+                    is_link = stat.S_ISLNK(os.lstat(file).st_mode)
+                except OSError:
+                    is_link = False
+                if not is_link:
+                    logger.info("软链接符号不存在 %s", file)
                     continue
-                if cleanlink and os.path.islink(file):
+                if cleanlink:
                     try:
                         target_file = os.readlink(file)
                         os.remove(target_file)
-                        logger.info(f"清除源文件 {target_file}")
+                        logger.info("清除源文件 %s", target_file)
                     except FileNotFoundError:
                         logger.warning(f"无法删除 {file} 指向的目标文件，目标文件不存在")
                     except OSError as e:
                         logger.error(f"删除 {file} 目标文件失败: {e}")
 
-                if os.path.islink(file) and not os.path.exists(file):
-                    os.remove(file)
-                    processed_list.remove(file)
-                    logger.info(f"删除本地链接文件 {file}")
+                # 一次stat判断链接目标是否已失效
+                try:
+                    os.stat(file)
+                    alive = True
+                except OSError:
+                    alive = False
 
-                    # 构造 CloudDrive2 目标路径
-                    cd2_dest = file.replace(self._softlink_prefix_path, self._cd_mount_prefix_path)
-                    strm_file_path = os.path.splitext(file)[0] + '.strm'
+                if not alive:
+                    os.remove(file)
+                    logger.info("删除本地链接文件 %s", file)
 
                     # 通知Cloud Media Sync处理文件
-                    if self._cloud_media_sync:
+                    if not self._cloud_media_sync:
+                        logger.info("未启用Cloud Media Sync，跳过文件处理：%s", file)
+                    elif self._cms_available():
                         file_info = {
                             "softlink_path": file,
-                            "cd2_path": cd2_dest,
-                            "strm_path": strm_file_path
+                            "cd2_path": self._to_cd2_path(file),
+                            "strm_path": os.path.splitext(file)[0] + '.strm'
                         }
                         self._notify_cloud_media_sync(file_info)
-                    else:
-                        logger.info(f"未启用Cloud Media Sync，跳过文件处理：{file}")
 
                 else:
-                    logger.debug(f"{file} 未失效，跳过")
+                    processed_list.append(file)
+                    logger.debug("%s 未失效，跳过", file)
 
             self.save_data('processed_list', processed_list)
 
@@ -1833,22 +3032,21 @@ class Cd2Upload(_PluginBase):
         if not self._cd2_confs:
             return
 
-        for cd2_conf in self._cd2_confs.split("\n"):
-            if not cd2_conf.strip():
+        for cd2_conf in self._cd2_confs.splitlines():
+            cd2_conf = cd2_conf.strip()
+            if not cd2_conf:
                 continue
             try:
-                parts = cd2_conf.strip().split("#")
+                parts = cd2_conf.split("#")
                 if len(parts) != 4:
                     logger.error(f"CloudDrive2配置格式错误：{cd2_conf}")
                     continue
 
                 cd2_name, cd2_url, username, password = parts
                 _cd2_client = CloudDriveClient(cd2_url, username, password)
-                _client = Client(cd2_url, username, password)
 
-                if _cd2_client and _client:
+                if _cd2_client:
                     self._cd2_clients[cd2_name] = _cd2_client
-                    self._clients[cd2_name] = _client
                     self._cd2_url[cd2_name] = cd2_url
                     logger.info(f"CloudDrive2客户端连接成功：{cd2_name}")
                 else:
@@ -1858,7 +3056,8 @@ class Cd2Upload(_PluginBase):
 
     def monitor_upload_tasks(self):
         """监控上传任务状态"""
-        if not self._cd2_clients:
+        # 失败任务仅用于发送通知，未开启通知时无需扫描
+        if not self._cd2_clients or not self._notify_upload:
             return
 
         for cd2_name, cd2_client in self._cd2_clients.items():
@@ -1868,16 +3067,16 @@ class Cd2Upload(_PluginBase):
                 if not upload_tasklist:
                     continue
 
-                failed_tasks = []
-                for task in upload_tasklist:
-                    if task.get("status") == "FatalError":
-                        failed_tasks.append({
-                            "name": task.get("name", "未知文件"),
-                            "error": task.get("errorMessage", "未知错误"),
-                            "cd2_name": cd2_name
-                        })
+                failed_tasks = [
+                    {
+                        "name": task.get("name", "未知文件"),
+                        "error": task.get("errorMessage", "未知错误"),
+                        "cd2_name": cd2_name
+                    }
+                    for task in upload_tasklist if task.get("status") == "FatalError"
+                ]
 
-                if failed_tasks and self._notify_upload:
+                if failed_tasks:
                     self._notify_upload_failures(failed_tasks)
 
             except Exception as e:
@@ -1909,13 +3108,8 @@ class Cd2Upload(_PluginBase):
             if not task:
                 break
 
-            # 在新线程中处理任务以支持并发
-            thread = threading.Thread(
-                target=self._process_queue_task,
-                args=(task,),
-                daemon=True
-            )
-            thread.start()
+            # 提交到常驻线程池中处理以支持并发
+            self._upload_executor.submit(self._process_queue_task, task)
             tasks_started += 1
 
         # 更新并发峰值统计
@@ -1928,7 +3122,7 @@ class Cd2Upload(_PluginBase):
 
     def _process_queue_task(self, task: UploadTask):
         """处理单个队列任务"""
-        logger.info(f"开始处理队列任务: {task.file_path} (优先级: {task.priority.name}, 重试次数: {task.retry_count})")
+        logger.info("开始处理队列任务: %s (优先级: %s, 重试次数: %d)", task.file_path, task.priority.name, task.retry_count)
 
         success = False
         error_type = None
@@ -1936,7 +3130,7 @@ class Cd2Upload(_PluginBase):
             success = self._upload_file(task.file_path, task.cd2_dest)
 
             if success:
-                logger.info(f"队列任务上传成功: {task.file_path}")
+                logger.info("队列任务上传成功: %s", task.file_path)
                 self._handle_successful_upload(task)
             else:
                 logger.error(f"队列任务上传失败: {task.file_path}")
@@ -1957,35 +3151,54 @@ class Cd2Upload(_PluginBase):
 
     def _handle_successful_upload(self, task: UploadTask):
         """处理上传成功的任务"""
-        with lock:
-            # 更新processed_list
-            processed_list = self.get_data('processed_list') or []
-            if task.file_path not in processed_list:
-                processed_list.append(task.file_path)
-                self.save_data('processed_list', processed_list)
-
-            # 从waiting_process_list中移除（如果存在）
-            waiting_list = self.get_data('waiting_process_list') or []
-            if task.file_path in waiting_list:
-                waiting_list.remove(task.file_path)
-                self.save_data('waiting_process_list', waiting_list)
+        # 暂存成功记录，5秒内的多次成功合并为一次写入
+        with self._pending_lock:
+            self._uploaded_buffer[task.file_path] = None
+            if self._uploaded_flush_timer is None:
+                self._uploaded_flush_timer = threading.Timer(5, self._flush_uploaded_buffer)
+                self._uploaded_flush_timer.daemon = True
+                self._uploaded_flush_timer.start()
 
         # 通知Cloud Media Sync处理文件
-        if self._cloud_media_sync:
-            cd2_dest = task.file_path.replace(self._softlink_prefix_path, self._cd_mount_prefix_path)
-            strm_file_path = os.path.splitext(task.file_path)[0] + '.strm'
-
+        if self._cloud_media_sync and self._cms_available():
             file_info = {
                 "softlink_path": task.file_path,
-                "cd2_path": cd2_dest,
-                "strm_path": strm_file_path,
+                "cd2_path": task.cd2_dest,
+                "strm_path": task.strm_path,
                 "media_type": task.media_info.type.value if task.media_info else "unknown"
             }
             self._notify_cloud_media_sync(file_info)
 
+    def _flush_uploaded_buffer(self):
+        """将暂存的成功记录批量写入processed_list，并从waiting_process_list中移除"""
+        with self._pending_lock:
+            uploaded = list(self._uploaded_buffer)
+            self._uploaded_buffer.clear()
+            if self._uploaded_flush_timer:
+                self._uploaded_flush_timer.cancel()
+                self._uploaded_flush_timer = None
+        if not uploaded:
+            return
+
+        with lock:
+            # 更新processed_list
+            processed_list = self.get_data('processed_list') or []
+            processed_set = set(processed_list)
+            new_files = [file for file in uploaded if file not in processed_set]
+            if new_files:
+                processed_list.extend(new_files)
+                self.save_data('processed_list', processed_list)
+
+            # 从waiting_process_list中移除（如果存在）
+            uploaded_set = set(uploaded)
+            waiting_list = self.get_data('waiting_process_list') or []
+            remaining = [file for file in waiting_list if file not in uploaded_set]
+            if len(remaining) != len(waiting_list):
+                self.save_data('waiting_process_list', remaining)
+
     def _handle_failed_upload(self, task: UploadTask):
         """智能处理上传失败的任务"""
-        max_attempts = self._max_retry_attempts if self._enable_smart_retry else self._upload_retry_count
+        policy = self._retry_policy
 
         # 检查错误是否可重试
         if task.error_type and not self._is_retryable_error(task.error_type):
@@ -1995,19 +3208,19 @@ class Cd2Upload(_PluginBase):
             if self._notify_upload:
                 self._send_notification(
                     title="CloudDrive2队列上传失败",
-                    text=f"文件上传失败: {os.path.basename(task.file_path)}\n错误类型: {task.error_type.value}\n错误详情: {task.last_error}"
+                    text=f"文件上传失败: {task.basename}\n错误类型: {task.error_type.value}\n错误详情: {task.last_error}"
                 )
             return
 
         # 如果还有重试机会，将任务重新加入队列
-        if task.retry_count < max_attempts:
+        if task.retry_count < policy.max_attempts:
             # 使用智能重试参数
             self._upload_queue.retry_task(
                 task,
-                max_attempts=self._max_retry_attempts,
-                base_delay=self._retry_base_delay,
-                max_delay=self._retry_max_delay,
-                enable_jitter=self._enable_jitter
+                max_attempts=policy.max_attempts,
+                base_delay=policy.base_delay,
+                max_delay=policy.max_delay,
+                enable_jitter=policy.enable_jitter
             )
 
             retry_time = time.strftime('%H:%M:%S', time.localtime(task.next_retry_time))
@@ -2024,7 +3237,7 @@ class Cd2Upload(_PluginBase):
 
                 self._send_notification(
                     title="CloudDrive2队列上传失败",
-                    text=f"文件上传失败: {os.path.basename(task.file_path)}\n重试 {task.retry_count} 次后仍然失败\n{error_info}"
+                    text=f"文件上传失败: {task.basename}\n重试 {task.retry_count} 次后仍然失败\n{error_info}"
                 )
 
     def _clean_queue_history(self):
@@ -2056,6 +3269,7 @@ class Cd2Upload(_PluginBase):
         except Exception as e:
             logger.error(f"清理统计数据失败: {e}")
 
+    @_ttl_cached(seconds=1)
     def get_statistics_dashboard(self) -> Dict:
         """获取统计仪表板数据"""
         if not self._statistics:
@@ -2067,14 +3281,16 @@ class Cd2Upload(_PluginBase):
                 "daily_summary": self._statistics.get_daily_summary(days=7),
                 "error_analysis": self._statistics.get_error_analysis(),
                 "queue_status": self.get_queue_status() if self._upload_queue else {"error": "队列未启用"},
-                "file_type_stats": dict(list(self._statistics.file_type_stats.items())[:10]),  # 前10种文件类型
-                "hourly_trend": dict(list(self._statistics.hourly_stats.items())[-24:])  # 最近24小时
+                "file_type_stats": dict(islice(self._statistics.file_type_stats.items(), 10)),  # 前10种文件类型
+                "hourly_trend": dict(reversed(list(
+                    islice(reversed(self._statistics.hourly_stats.items()), 24))))  # 最近24小时
             }
             return dashboard_data
         except Exception as e:
             logger.error(f"获取统计数据失败: {e}")
             return {"error": f"获取统计数据失败: {str(e)}"}
 
+    @_ttl_cached(seconds=1)
     def get_performance_metrics(self) -> Dict:
         """获取性能指标"""
         if not self._statistics:
@@ -2100,6 +3316,7 @@ class Cd2Upload(_PluginBase):
             logger.error(f"获取性能指标失败: {e}")
             return {"error": f"获取性能指标失败: {str(e)}"}
 
+    @_ttl_cached(seconds=1)
     def get_error_report(self) -> Dict:
         """获取错误报告"""
         if not self._statistics:
@@ -2111,9 +3328,10 @@ class Cd2Upload(_PluginBase):
             # 获取队列中的失败任务详情
             queue_failures = []
             if self._upload_queue:
-                for failed_task in self._upload_queue.failed_uploads[-10:]:  # 最近10个失败任务
+                failed_uploads = self._upload_queue.failed_uploads
+                for failed_task in islice(failed_uploads, max(len(failed_uploads) - 10, 0), None):  # 最近10个失败任务
                     queue_failures.append({
-                        "file": os.path.basename(failed_task.file_path),
+                        "file": failed_task.basename,
                         "error_type": failed_task.error_type.value if failed_task.error_type else "unknown",
                         "last_error": failed_task.last_error,
                         "retry_count": failed_task.retry_count,
@@ -2124,7 +3342,8 @@ class Cd2Upload(_PluginBase):
                 "error_statistics": error_analysis,
                 "recent_failures": queue_failures,
                 "total_error_types": len(error_analysis),
-                "most_common_error": max(error_analysis.items(), key=lambda x: x[1]) if error_analysis else None
+                # error_analysis 已按次数降序排列
+                "most_common_error": next(iter(error_analysis.items()), None)
             }
         except Exception as e:
             logger.error(f"获取错误报告失败: {e}")
@@ -2216,13 +3435,17 @@ class Cd2Upload(_PluginBase):
 
         try:
             log_dir = self._enterprise_logger.log_dir
-            cutoff_date = datetime.now() - timedelta(days=self._log_retention_days)
+            cutoff_ts = (datetime.now() - timedelta(days=self._log_retention_days)).timestamp()
 
             cleaned_files = 0
-            for log_file in log_dir.glob("*.log*"):
-                if log_file.stat().st_mtime < cutoff_date.timestamp():
-                    log_file.unlink()
-                    cleaned_files += 1
+            # scandir 的 DirEntry 会缓存类型信息，避免逐个文件额外stat
+            with os.scandir(log_dir) as entries:
+                for entry in entries:
+                    if '.log' not in entry.name or not entry.is_file(follow_symlinks=False):
+                        continue
+                    if entry.stat(follow_symlinks=False).st_mtime < cutoff_ts:
+                        os.unlink(entry.path)
+                        cleaned_files += 1
 
             if cleaned_files > 0:
                 logger.info(f"清理了 {cleaned_files} 个过期日志文件")
@@ -2296,12 +3519,13 @@ class Cd2Upload(_PluginBase):
 
         return self._api_handler.handle_request(path, method, params, headers)
 
-    def register_webhook(self, event_type: str, url: str, secret: str = None, headers: Dict = None) -> str:
+    def register_webhook(self, event_type: str, url: str, secret: str = None, headers: Dict = None,
+                         batch: bool = False) -> str:
         """注册WebHook（供外部调用）"""
         if not self._webhook_manager:
             raise RuntimeError("WebHook功能未启用")
 
-        return self._webhook_manager.register_webhook(event_type, url, secret, headers)
+        return self._webhook_manager.register_webhook(event_type, url, secret, headers, batch=batch)
 
     def unregister_webhook(self, webhook_id: str) -> bool:
         """注销WebHook"""
@@ -2311,916 +3535,322 @@ class Cd2Upload(_PluginBase):
         return self._webhook_manager.unregister_webhook(webhook_id)
 
     def list_webhooks(self) -> List[Dict]:
-        """列出WebHook"""
-        if not self._webhook_manager:
-            return []
-
-        return self._webhook_manager.list_webhooks()
-
-    def stop_service(self):
-        """停止服务"""
-        try:
-            if self._scheduler:
-                self._scheduler.shutdown()
-                self._scheduler = None
-
-            if self._webhook_manager:
-                self._webhook_manager.stop()
-                self._webhook_manager = None
-
-            logger.info("CloudDrive2智能上传服务已停止")
-        except Exception as e:
-            logger.error(f"停止服务时出错: {e}")
-
-    def _send_notification(self, title: str, text: str = None, image: str = None):
-        """发送通知，支持通知渠道选择"""
-        # 获取通知类型
-        try:
-            mtype = NotificationType.__getitem__(
-                self._notification_type) if self._notification_type else NotificationType.Plugin
-        except (KeyError, AttributeError):
-            mtype = NotificationType.Plugin
-
-        # 如果指定了通知渠道
-        if self._notification_channels:
-            channels = [ch.strip() for ch in self._notification_channels.split(",") if ch.strip()]
-            for channel in channels:
-                try:
-                    self.post_message(
-                        title=title,
-                        text=text,
-                        image=image,
-                        mtype=mtype,
-                        channel=channel
-                    )
-                except Exception as e:
-                    logger.error(f"发送通知到渠道 {channel} 失败: {e}")
-        else:
-            # 使用默认通知方式
-            self.post_message(
-                title=title,
-                text=text,
-                image=image,
-                mtype=mtype
-            )
-
-    def _notify_cloud_media_sync(self, file_info: Dict):
-        """通知Cloud Media Sync处理STRM生成"""
-        if not self._cloud_media_sync:
-            logger.info("未启用Cloud Media Sync通知，跳过")
-            return
-
-        # 构造通知数据
-        event_data = {
-            "source": "CloudDrive2智能上传",
-            "action": "strm_generate_request",
-            "file_path": file_info.get("softlink_path"),
-            "cloud_path": file_info.get("cd2_path"),
-            "strm_path": file_info.get("strm_path"),
-            "upload_completed": True,
-            "media_type": file_info.get("media_type", "unknown"),
-            "timestamp": datetime.now().isoformat()
-        }
-
-        # 发送插件通信事件
-        event = Event(EventType.PluginAction, {
-            "plugin_name": "CloudMediaSync",
-            "action": "handle_upload_completion",
-            "data": event_data
-        })
-        eventmanager.send_event(event)
-
-        logger.info(f"已通知Cloud Media Sync处理文件: {file_info.get('softlink_path')}")
-
-    def check_cookie_status(self):
-        """检查CloudDrive2 Cookie状态"""
-        if not self._cd2_clients:
-            return
-
-        for cd2_name, cd2_client in self._cd2_clients.items():
-            try:
-                logger.info(f"开始检查 {cd2_name} Cookie状态")
-                fs = cd2_client.fs
-                if not fs:
-                    logger.error(f"{cd2_name} CloudDrive2连接失败")
-                    continue
-
-                # 获取目录列表并检查是否可访问
-                for dir_item in fs.listdir():
-                    if dir_item and dir_item not in self._black_dirs.split(","):
-                        try:
-                            cloud_files = fs.listdir(dir_item)
-                            if cloud_files is None:
-                                error_msg = f"云盘 {dir_item} Cookie可能已过期"
-                                logger.warning(error_msg)
-                                if self._notify_upload:
-                                    self._send_notification(
-                                        title=f"CloudDrive2 Cookie警告",
-                                        text=f"【{cd2_name}】{error_msg}"
-                                    )
-                        except Exception as err:
-                            error_msg = f"云盘 {dir_item} 访问异常"
-                            logger.error(f"{error_msg}: {err}")
-                            if "429" in str(err):
-                                error_msg = f"云盘 {dir_item} 访问频率过高，请稍后再试"
-                            if self._notify_upload:
-                                self._send_notification(
-                                    title=f"CloudDrive2 Cookie错误",
-                                    text=f"【{cd2_name}】{error_msg}: {err}"
-                                )
+        """列出WebHook"""
+        if not self._webhook_manager:
+            return []
 
-            except Exception as e:
-                logger.error(f"检查{cd2_name} Cookie状态失败：{e}")
+        return self._webhook_manager.list_webhooks()
 
-    @eventmanager.register(EventType.WebhookMessage)
-    def record_favor(self, event: Event):
-        """
-        记录favorite剧集，支持收藏更新通知
-        """
-        # 检查是否启用收藏通知功能
-        if not self._enable_favorite_notify:
+    def _post_async(self, func, *args, **kwargs):
+        """将通知发送放入后台队列，队列未启动时直接发送"""
+        notify_queue = self._notify_queue
+        if notify_queue is None:
+            func(*args, **kwargs)
             return
+        try:
+            notify_queue.put_nowait((func, args, kwargs))
+        except Full:
+            logger.warning("通知队列已满，丢弃通知")
 
-        event_info: WebhookEventInfo = event.event_data
-        # 只处理剧集喜爱事件
-        if event_info.event != "item.rate" or event_info.item_type != "TV":
-            return
-        if event_info.channel != "emby":
-            logger.info("目前只支持Emby服务端")
-            return
-        title = event_info.item_name
-        tmdb_id = event_info.tmdb_id
-        if title.count(" S"):
-            logger.info("只处理喜爱整季，单集喜爱不处理")
+    @staticmethod
+    def _notify_worker(notify_queue: Queue):
+        """通知发送线程，连续排队的相同通知合并为一条发送"""
+        while True:
+            # 一次取出当前已排队的通知（不等待凑批）
+            batch = [notify_queue.get()]
+            while len(batch) < 100:
+                try:
+                    batch.append(notify_queue.get_nowait())
+                except Empty:
+                    break
+
+            for item, group in groupby(batch):
+                if item is _SHUTDOWN:
+                    return
+                func, args, kwargs = item
+                count = sum(1 for _ in group)
+                if count > 1 and args and isinstance(args[0], str):
+                    # 合并的通知在标题后标注次数
+                    args = (f"{args[0]} (×{count})",) + args[1:]
+                try:
+                    func(*args, **kwargs)
+                except Exception as e:
+                    logger.error(f"发送通知失败: {e}")
+
+    def _stop_notify_worker(self):
+        """发送完已排队的通知后停止通知线程"""
+        notify_queue, notify_thread = self._notify_queue, self._notify_thread
+        self._notify_queue = self._notify_thread = None
+        if notify_queue is None:
             return
         try:
-            meta = MetaInfo(title)
-            mediainfo: MediaInfo = self.chain.recognize_media(meta=meta, tmdbid=tmdb_id, mtype=MediaType.TV)
-            # 存储历史记录
-            favor: Dict = self.get_data('favor') or {}
-            if favor.get(tmdb_id):
-                favor.pop(tmdb_id)
-                logger.info(f"{mediainfo.title_year} 取消更新通知")
-                self.chain.post_message(Notification(
-                    mtype=NotificationType.Plugin,
-                    title=f"{mediainfo.title_year} 取消更新通知", text=None, image=mediainfo.get_message_image()))
-            else:
-                favor[tmdb_id] = {
-                    "title": title,
-                    "type": mediainfo.type.value,
-                    "year": mediainfo.year,
-                    "poster": mediainfo.get_poster_image(),
-                    "overview": mediainfo.overview,
-                    "tmdbid": mediainfo.tmdb_id,
-                    "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                }
-                logger.info(f"{mediainfo.title_year} 加入更新通知")
-                self.chain.post_message(Notification(
-                    mtype=NotificationType.Plugin,
-                    title=f"{mediainfo.title_year} 加入更新通知", text=None, image=mediainfo.get_message_image()))
-            self.save_data('favor', favor)
-        except Exception as e:
-            logger.error(str(e))
+            notify_queue.put(_SHUTDOWN, timeout=1)
+        except Full:
+            logger.warning("通知队列已满，未发送的通知将被丢弃")
+            return
+        if notify_thread:
+            notify_thread.join(timeout=5)
 
-    def get_state(self) -> bool:
-        return self._enable
+    def _send_notification(self, title: str, text: str = None, image: str = None):
+        """发送通知（异步），支持通知渠道选择"""
+        self._post_async(self._deliver_notification, title, text, image)
 
-    @staticmethod
-    def get_command() -> List[Dict[str, Any]]:
-        pass
+    def _deliver_notification(self, title: str, text: str = None, image: str = None):
+        """按配置的通知渠道发送通知"""
+        # 通知类型在加载配置时已解析
+        mtype = self._notification_mtype
 
-    def get_form(self) -> Tuple[List[dict], Dict[str, Any]]:
-        """
-        拼装插件配置页面，需要返回两块数据：1、页面配置；2、数据结构
-        """
-        return [
-            {
-                'component': 'VForm',
-                'content': [
-                    # 企业级Header
-                    {
-                        'component': 'VCard',
-                        'props': {
-                            'variant': 'outlined',
-                            'class': 'mb-4 enterprise-header-card'
-                        },
-                        'content': [
-                            {
-                                'component': 'VCardItem',
-                                'content': [
-                                    {
-                                        'component': 'VCardTitle',
-                                        'props': {
-                                            'class': 'd-flex align-center'
-                                        },
-                                        'content': [
-                                            {
-                                                'component': 'VIcon',
-                                                'props': {
-                                                    'icon': 'mdi-cloud-upload',
-                                                    'class': 'me-3',
-                                                    'color': 'primary',
-                                                    'size': 'large'
-                                                }
-                                            },
-                                            {
-                                                'component': 'div',
-                                                'props': {
-                                                    'class': 'text-h5'
-                                                },
-                                                'content': [
-                                                    {
-                                                        'component': 'span',
-                                                        'text': 'CloudDrive2 智能上传'
-                                                    },
-                                                    {
-                                                        'component': 'VChip',
-                                                        'props': {
-                                                            'size': 'small',
-                                                            'color': 'success',
-                                                            'variant': 'flat',
-                                                            'class': 'ms-3'
-                                                        },
-                                                        'content': [
-                                                            {
-                                                                'component': 'VIcon',
-                                                                'props': {
-                                                                    'icon': 'mdi-crown',
-                                                                    'start': True,
-                                                                    'size': 'small'
-                                                                }
-                                                            },
-                                                            {
-                                                                'component': 'span',
-                                                                'text': 'Enterprise'
-                                                            }
-                                                        ]
-                                                    }
-                                                ]
-                                            }
-                                        ]
-                                    },
-                                    {
-                                        'component': 'VCardSubtitle',
-                                        'props': {
-                                            'class': 'mt-2 text-medium-emphasis'
-                                        },
-                                        'content': [
-                                            {
-                                                'component': 'span',
-                                                'text': '企业级文件上传管理系统 | 队列管理 | 健康监控 | API集成 | 实时统计'
-                                            }
-                                        ]
-                                    }
-                                ]
-                            }
-                        ]
-                    },
+        # 如果指定了通知渠道
+        if self._notification_channel_list:
+            if self._notify_executor:
+                # 各渠道并发发送，总耗时取决于最慢的渠道
+                futures = {
+                    self._notify_executor.submit(self.post_message, title=title, text=text, image=image,
+                                                 mtype=mtype, channel=channel): channel
+                    for channel in self._notification_channel_list
+                }
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"发送通知到渠道 {futures[future]} 失败: {e}")
+                return
 
-                    # 快速操作面板
-                    {
-                        'component': 'VRow',
-                        'props': {
-                            'class': 'mb-4'
-                        },
-                        'content': [
-                            {
-                                'component': 'VCol',
-                                'props': {
-                                    'cols': 12,
-                                    'md': 3
-                                },
-                                'content': [
-                                    {
-                                        'component': 'VSwitch',
-                                        'props': {
-                                            'model': 'enable',
-                                            'label': '启用插件',
-                                            'color': 'primary',
-                                            'hide-details': True
-                                        }
-                                    }
-                                ]
-                            },
-                            {
-                                'component': 'VCol',
-                                'props': {
-                                    'cols': 12,
-                                    'md': 3
-                                },
-                                'content': [
-                                    {
-                                        'component': 'VSwitch',
-                                        'props': {
-                                            'model': 'onlyonce',
-                                            'label': '立即运行一次',
-                                            'color': 'warning',
-                                            'hide-details': True
-                                        }
-                                    }
-                                ]
-                            },
-                            {
-                                'component': 'VCol',
-                                'props': {
-                                    'cols': 12,
-                                    'md': 3
-                                },
-                                'content': [
-                                    {
-                                        'component': 'VSwitch',
-                                        'props': {
-                                            'model': 'cleanlink',
-                                            'label': '立即清理',
-                                            'color': 'error',
-                                            'hide-details': True
-                                        }
-                                    }
-                                ]
-                            },
-                            {
-                                'component': 'VCol',
-                                'props': {
-                                    'cols': 12,
-                                    'md': 3
-                                },
-                                'content': [
-                                    {
-                                        'component': 'VTextField',
-                                        'props': {
-                                            'model': 'cron',
-                                            'label': '延迟上传（分钟）',
-                                            'placeholder': '20',
-                                            'variant': 'outlined',
-                                            'type': 'number',
-                                            'hide-details': True
-                                        }
-                                    }
-                                ]
-                            }
-                        ]
-                    },
+            for channel in self._notification_channel_list:
+                try:
+                    self.post_message(
+                        title=title,
+                        text=text,
+                        image=image,
+                        mtype=mtype,
+                        channel=channel
+                    )
+                except Exception as e:
+                    logger.error(f"发送通知到渠道 {channel} 失败: {e}")
+        else:
+            # 使用默认通知方式
+            self.post_message(
+                title=title,
+                text=text,
+                image=image,
+                mtype=mtype
+            )
 
-                    # 基本路径配置
-                    {
-                        'component': 'VRow',
-                        'props': {
-                            'class': 'mb-4'
-                        },
-                        'content': [
-                            {
-                                'component': 'VCol',
-                                'props': {
-                                    'cols': 12,
-                                    'md': 6
-                                },
-                                'content': [
-                                    {
-                                        'component': 'VTextField',
-                                        'props': {
-                                            'model': 'softlink_prefix_path',
-                                            'label': '本地软链接路径前缀',
-                                            'placeholder': '/strm/',
-                                            'variant': 'outlined',
-                                            'hide-details': True,
-                                            'prepend-inner-icon': 'mdi-folder-open'
-                                        }
-                                    }
-                                ]
-                            },
-                            {
-                                'component': 'VCol',
-                                'props': {
-                                    'cols': 12,
-                                    'md': 6
-                                },
-                                'content': [
-                                    {
-                                        'component': 'VTextField',
-                                        'props': {
-                                            'model': 'cd_mount_prefix_path',
-                                            'label': 'CloudDrive2挂载路径前缀',
-                                            'placeholder': '/CloudNAS/115/emby/',
-                                            'variant': 'outlined',
-                                            'hide-details': True,
-                                            'prepend-inner-icon': 'mdi-cloud'
-                                        }
-                                    }
-                                ]
-                            }
-                        ]
-                    },
+    def _notify_cloud_media_sync(self, file_info: Dict):
+        """通知Cloud Media Sync处理STRM生成"""
+        if not self._cloud_media_sync:
+            logger.info("未启用Cloud Media Sync通知，跳过")
+            return
+        if not self._cms_available():
+            return
 
-                    # 配置面板组
-                    {
-                        'component': 'VExpansionPanels',
-                        'props': {
-                            'multiple': True,
-                            'variant': 'accordion',
-                            'class': 'enterprise-panels'
-                        },
-                        'content': [
-                            # 监控配置
-                            {
-                                'component': 'VExpansionPanel',
-                                'props': {
-                                    'value': 'monitoring'
-                                },
-                                'content': [
-                                    {
-                                        'component': 'VExpansionPanelTitle',
-                                        'content': [
-                                            {
-                                                'component': 'div',
-                                                'props': {
-                                                    'class': 'd-flex align-center'
-                                                },
-                                                'content': [
-                                                    {
-                                                        'component': 'VIcon',
-                                                        'props': {
-                                                            'icon': 'mdi-monitor',
-                                                            'class': 'me-3',
-                                                            'color': 'info'
-                                                        }
-                                                    },
-                                                    {
-                                                        'component': 'span',
-                                                        'props': {
-                                                            'class': 'text-h6'
-                                                        },
-                                                        'text': '监控配置'
-                                                    }
-                                                ]
-                                            }
-                                        ]
-                                    },
-                                    {
-                                        'component': 'VExpansionPanelText',
-                                        'content': [
-                                            {
-                                                'component': 'VRow',
-                                                'content': [
-                                                    {
-                                                        'component': 'VCol',
-                                                        'props': {'cols': 12, 'md': 4},
-                                                        'content': [{
-                                                            'component': 'VSwitch',
-                                                            'props': {
-                                                                'model': 'monitor_upload',
-                                                                'label': '开启上传监控',
-                                                                'color': 'success',
-                                                                'hide-details': True
-                                                            }
-                                                        }]
-                                                    },
-                                                    {
-                                                        'component': 'VCol',
-                                                        'props': {'cols': 12, 'md': 4},
-                                                        'content': [{
-                                                            'component': 'VSwitch',
-                                                            'props': {
-                                                                'model': 'notify_upload',
-                                                                'label': '上传通知',
-                                                                'color': 'warning',
-                                                                'hide-details': True
-                                                            }
-                                                        }]
-                                                    },
-                                                    {
-                                                        'component': 'VCol',
-                                                        'props': {'cols': 12, 'md': 4},
-                                                        'content': [{
-                                                            'component': 'VSwitch',
-                                                            'props': {
-                                                                'model': 'enable_favorite_notify',
-                                                                'label': '收藏通知',
-                                                                'color': 'error',
-                                                                'hide-details': True
-                                                            }
-                                                        }]
-                                                    }
-                                                ]
-                                            },
-                                            {
-                                                'component': 'VRow',
-                                                'content': [
-                                                    {
-                                                        'component': 'VCol',
-                                                        'props': {'cols': 12, 'md': 6},
-                                                        'content': [{
-                                                            'component': 'VTextField',
-                                                            'props': {
-                                                                'model': 'monitor_interval',
-                                                                'label': '监控间隔（分钟）',
-                                                                'placeholder': '10',
-                                                                'variant': 'outlined',
-                                                                'type': 'number',
-                                                                'hide-details': True
-                                                            }
-                                                        }]
-                                                    },
-                                                    {
-                                                        'component': 'VCol',
-                                                        'props': {'cols': 12, 'md': 6},
-                                                        'content': [{
-                                                            'component': 'VTextField',
-                                                            'props': {
-                                                                'model': 'clean_interval',
-                                                                'label': '清理间隔（分钟）',
-                                                                'placeholder': '60',
-                                                                'variant': 'outlined',
-                                                                'type': 'number',
-                                                                'hide-details': True
-                                                            }
-                                                        }]
-                                                    }
-                                                ]
-                                            }
-                                        ]
-                                    }
-                                ]
-                            },
+        # 构造通知数据
+        event_data = {
+            "source": "CloudDrive2智能上传",
+            "action": "strm_generate_request",
+            "file_path": file_info.get("softlink_path"),
+            "cloud_path": file_info.get("cd2_path"),
+            "strm_path": file_info.get("strm_path"),
+            "upload_completed": True,
+            "media_type": file_info.get("media_type", "unknown"),
+            "timestamp": datetime.now().isoformat()
+        }
 
-                            # 上传配置
-                            {
-                                'component': 'VExpansionPanel',
-                                'props': {
-                                    'value': 'upload'
-                                },
-                                'content': [
-                                    {
-                                        'component': 'VExpansionPanelTitle',
-                                        'content': [
-                                            {
-                                                'component': 'div',
-                                                'props': {
-                                                    'class': 'd-flex align-center'
-                                                },
-                                                'content': [
-                                                    {
-                                                        'component': 'VIcon',
-                                                        'props': {
-                                                            'icon': 'mdi-upload',
-                                                            'class': 'me-3',
-                                                            'color': 'success'
-                                                        }
-                                                    },
-                                                    {
-                                                        'component': 'span',
-                                                        'props': {
-                                                            'class': 'text-h6'
-                                                        },
-                                                        'text': '上传配置'
-                                                    }
-                                                ]
-                                            }
-                                        ]
-                                    },
-                                    {
-                                        'component': 'VExpansionPanelText',
-                                        'content': [
-                                            {
-                                                'component': 'VRow',
-                                                'content': [
-                                                    {
-                                                        'component': 'VCol',
-                                                        'props': {'cols': 12, 'md': 3},
-                                                        'content': [{
-                                                            'component': 'VTextField',
-                                                            'props': {
-                                                                'model': 'upload_timeout',
-                                                                'label': '上传超时（分钟）',
-                                                                'placeholder': '60',
-                                                                'variant': 'outlined',
-                                                                'type': 'number',
-                                                                'hide-details': True
-                                                            }
-                                                        }]
-                                                    },
-                                                    {
-                                                        'component': 'VCol',
-                                                        'props': {'cols': 12, 'md': 3},
-                                                        'content': [{
-                                                            'component': 'VTextField',
-                                                            'props': {
-                                                                'model': 'upload_retry_count',
-                                                                'label': '重试次数',
-                                                                'placeholder': '3',
-                                                                'variant': 'outlined',
-                                                                'type': 'number',
-                                                                'hide-details': True
-                                                            }
-                                                        }]
-                                                    },
-                                                    {
-                                                        'component': 'VCol',
-                                                        'props': {'cols': 12, 'md': 3},
-                                                        'content': [{
-                                                            'component': 'VSwitch',
-                                                            'props': {
-                                                                'model': 'delete_source_after_upload',
-                                                                'label': '删除源文件',
-                                                                'color': 'error',
-                                                                'hide-details': True
-                                                            }
-                                                        }]
-                                                    },
-                                                    {
-                                                        'component': 'VCol',
-                                                        'props': {'cols': 12, 'md': 3},
-                                                        'content': [{
-                                                            'component': 'VSwitch',
-                                                            'props': {
-                                                                'model': 'enable_cookie_check',
-                                                                'label': 'Cookie检测',
-                                                                'color': 'warning',
-                                                                'hide-details': True
-                                                            }
-                                                        }]
-                                                    }
-                                                ]
-                                            }
-                                        ]
-                                    }
-                                ]
-                            },
+        # 发送插件通信事件
+        event = Event(EventType.PluginAction, {
+            "plugin_name": "CloudMediaSync",
+            "action": "handle_upload_completion",
+            "data": event_data
+        })
+        eventmanager.send_event(event)
 
-                            # 企业级功能
-                            {
-                                'component': 'VExpansionPanel',
-                                'props': {
-                                    'value': 'enterprise'
-                                },
-                                'content': [
-                                    {
-                                        'component': 'VExpansionPanelTitle',
-                                        'content': [
-                                            {
-                                                'component': 'div',
-                                                'props': {
-                                                    'class': 'd-flex align-center'
-                                                },
-                                                'content': [
-                                                    {
-                                                        'component': 'VIcon',
-                                                        'props': {
-                                                            'icon': 'mdi-crown',
-                                                            'class': 'me-3',
-                                                            'color': 'warning'
-                                                        }
-                                                    },
-                                                    {
-                                                        'component': 'span',
-                                                        'props': {
-                                                            'class': 'text-h6'
-                                                        },
-                                                        'text': '企业级功能'
-                                                    },
-                                                    {
-                                                        'component': 'VChip',
-                                                        'props': {
-                                                            'size': 'small',
-                                                            'color': 'warning',
-                                                            'variant': 'flat',
-                                                            'class': 'ms-3'
-                                                        },
-                                                        'content': [
-                                                            {
-                                                                'component': 'span',
-                                                                'text': 'Enterprise'
-                                                            }
-                                                        ]
-                                                    }
-                                                ]
-                                            }
-                                        ]
-                                    },
-                                    {
-                                        'component': 'VExpansionPanelText',
-                                        'content': [
-                                            {
-                                                'component': 'VRow',
-                                                'content': [
-                                                    {
-                                                        'component': 'VCol',
-                                                        'props': {'cols': 12, 'md': 4},
-                                                        'content': [{
-                                                            'component': 'VSwitch',
-                                                            'props': {
-                                                                'model': 'enable_enterprise_logging',
-                                                                'label': '企业级日志',
-                                                                'color': 'primary',
-                                                                'hide-details': True
-                                                            }
-                                                        }]
-                                                    },
-                                                    {
-                                                        'component': 'VCol',
-                                                        'props': {'cols': 12, 'md': 4},
-                                                        'content': [{
-                                                            'component': 'VSwitch',
-                                                            'props': {
-                                                                'model': 'enable_distributed_lock',
-                                                                'label': '分布式锁',
-                                                                'color': 'success',
-                                                                'hide-details': True
-                                                            }
-                                                        }]
-                                                    },
-                                                    {
-                                                        'component': 'VCol',
-                                                        'props': {'cols': 12, 'md': 4},
-                                                        'content': [{
-                                                            'component': 'VSwitch',
-                                                            'props': {
-                                                                'model': 'enable_health_check',
-                                                                'label': '健康检查',
-                                                                'color': 'info',
-                                                                'hide-details': True
-                                                            }
-                                                        }]
-                                                    }
-                                                ]
-                                            },
-                                            {
-                                                'component': 'VRow',
-                                                'content': [
-                                                    {
-                                                        'component': 'VCol',
-                                                        'props': {'cols': 12, 'md': 4},
-                                                        'content': [{
-                                                            'component': 'VSwitch',
-                                                            'props': {
-                                                                'model': 'enable_quota_management',
-                                                                'label': '配额管理',
-                                                                'color': 'warning',
-                                                                'hide-details': True
-                                                            }
-                                                        }]
-                                                    },
-                                                    {
-                                                        'component': 'VCol',
-                                                        'props': {'cols': 12, 'md': 4},
-                                                        'content': [{
-                                                            'component': 'VSwitch',
-                                                            'props': {
-                                                                'model': 'enable_api_handler',
-                                                                'label': 'REST API',
-                                                                'color': 'error',
-                                                                'hide-details': True
-                                                            }
-                                                        }]
-                                                    },
-                                                    {
-                                                        'component': 'VCol',
-                                                        'props': {'cols': 12, 'md': 4},
-                                                        'content': [{
-                                                            'component': 'VSwitch',
-                                                            'props': {
-                                                                'model': 'enable_webhook_manager',
-                                                                'label': 'WebHook',
-                                                                'color': 'deep-purple',
-                                                                'hide-details': True
-                                                            }
-                                                        }]
-                                                    }
-                                                ]
-                                            }
-                                        ]
-                                    }
-                                ]
-                            },
+        logger.info("已通知Cloud Media Sync处理文件: %s", file_info.get('softlink_path'))
 
-                            # 高级配置
-                            {
-                                'component': 'VExpansionPanel',
-                                'props': {
-                                    'value': 'advanced'
-                                },
-                                'content': [
-                                    {
-                                        'component': 'VExpansionPanelTitle',
-                                        'content': [
-                                            {
-                                                'component': 'div',
-                                                'props': {
-                                                    'class': 'd-flex align-center'
-                                                },
-                                                'content': [
-                                                    {
-                                                        'component': 'VIcon',
-                                                        'props': {
-                                                            'icon': 'mdi-cogs',
-                                                            'class': 'me-3',
-                                                            'color': 'deep-purple'
-                                                        }
-                                                    },
-                                                    {
-                                                        'component': 'span',
-                                                        'props': {
-                                                            'class': 'text-h6'
-                                                        },
-                                                        'text': '高级配置'
-                                                    }
-                                                ]
-                                            }
-                                        ]
-                                    },
-                                    {
-                                        'component': 'VExpansionPanelText',
-                                        'content': [
-                                            {
-                                                'component': 'VRow',
-                                                'content': [
-                                                    {
-                                                        'component': 'VCol',
-                                                        'props': {'cols': 12, 'md': 6},
-                                                        'content': [{
-                                                            'component': 'VTextarea',
-                                                            'props': {
-                                                                'model': 'cd2_confs',
-                                                                'label': 'CloudDrive2配置',
-                                                                'placeholder': 'host: http://ip:19798\nusername: admin\npassword: passwd\nsavepath: /home/media\nuploadpath: CD2Upload\nrootpath: 115\n\n---\n#组2配置...',
-                                                                'variant': 'outlined',
-                                                                'rows': 6,
-                                                                'hide-details': True
-                                                            }
-                                                        }]
-                                                    },
-                                                    {
-                                                        'component': 'VCol',
-                                                        'props': {'cols': 12, 'md': 6},
-                                                        'content': [{
-                                                            'component': 'VTextarea',
-                                                            'props': {
-                                                                'model': 'black_dirs',
-                                                                'label': '过滤目录',
-                                                                'placeholder': '每行一个目录，支持正则表达式\n例如：\n.*\\.tmp$\n/temp/\n.*test.*',
-                                                                'variant': 'outlined',
-                                                                'rows': 6,
-                                                                'hide-details': True
-                                                            }
-                                                        }]
-                                                    }
-                                                ]
-                                            },
-                                            {
-                                                'component': 'VRow',
-                                                'content': [
-                                                    {
-                                                        'component': 'VCol',
-                                                        'props': {'cols': 12},
-                                                        'content': [{
-                                                            'component': 'VTextField',
-                                                            'props': {
-                                                                'model': 'cloud_media_sync',
-                                                                'label': 'Cloud Media Sync插件ID',
-                                                                'placeholder': '请在Cloud Media Sync插件中查看其Plugin ID',
-                                                                'variant': 'outlined',
-                                                                'hide-details': True,
-                                                                'prepend-inner-icon': 'mdi-link'
-                                                            }
-                                                        }]
-                                                    }
-                                                ]
-                                            }
-                                        ]
-                                    }
-                                ]
-                            }
-                        ]
+    def _cms_available(self) -> bool:
+        """配置的Cloud Media Sync插件是否在运行，结果缓存60秒"""
+        plugin_id = self._cloud_media_sync
+        if not isinstance(plugin_id, str) or not plugin_id.strip():
+            # 未填写插件ID（旧配置为开关）时无法判断，按在运行处理
+            return True
+        now = time.monotonic()
+        if now - self._cms_checked_at >= 60:
+            try:
+                from app.core.plugin import PluginManager
+                self._cms_running = plugin_id.strip() in PluginManager().get_running_plugin_ids()
+            except Exception as e:
+                # 无法判断时按在运行处理，避免漏发事件
+                logger.debug(f"获取Cloud Media Sync运行状态失败: {e}")
+                self._cms_running = True
+            self._cms_checked_at = now
+            if not self._cms_running:
+                logger.info("Cloud Media Sync 插件未运行，跳过通知")
+        return self._cms_running
+
+    def check_cookie_status(self):
+        """检查CloudDrive2 Cookie状态"""
+        if not self._cd2_clients:
+            return
+
+        # 循环内使用的配置绑定到局部变量
+        black_dirs = self._black_dir_set
+        # 本次检查发现的问题，结束后汇总为一条通知
+        warning_msgs = []
+        error_msgs = []
+
+        for cd2_name, cd2_client in self._cd2_clients.items():
+            try:
+                logger.info(f"开始检查 {cd2_name} Cookie状态")
+                fs = cd2_client.fs
+                if not fs:
+                    logger.error(f"{cd2_name} CloudDrive2连接失败")
+                    continue
+
+                # 获取目录列表，并发检查各云盘是否可访问
+                dir_items = [dir_item for dir_item in fs.listdir()
+                             if dir_item and dir_item not in black_dirs]
+                if not dir_items:
+                    continue
+
+                with ThreadPoolExecutor(max_workers=min(len(dir_items), 16),
+                                        thread_name_prefix="cd2upload-cookie") as executor:
+                    futures = {executor.submit(fs.listdir, dir_item): dir_item for dir_item in dir_items}
+                    for future in as_completed(futures):
+                        dir_item = futures[future]
+                        try:
+                            cloud_files = future.result()
+                            if cloud_files is None:
+                                error_msg = f"云盘 {dir_item} Cookie可能已过期"
+                                logger.warning(error_msg)
+                                warning_msgs.append(f"【{cd2_name}】{error_msg}")
+                        except Exception as err:
+                            err_text = str(err)
+                            error_msg = f"云盘 {dir_item} 访问异常"
+                            logger.error(f"{error_msg}: {err_text}")
+                            if _is_rate_limited(err, err_text):
+                                error_msg = f"云盘 {dir_item} 访问频率过高，请稍后再试"
+                            error_msgs.append(f"【{cd2_name}】{error_msg}: {err_text}")
+
+            except Exception as e:
+                logger.error(f"检查{cd2_name} Cookie状态失败：{e}")
+
+        if self._notify_upload and (warning_msgs or error_msgs):
+            self._send_notification(
+                title="CloudDrive2 Cookie错误" if error_msgs else "CloudDrive2 Cookie警告",
+                text="\n".join(error_msgs + warning_msgs)
+            )
+
+    @eventmanager.register(EventType.WebhookMessage)
+    def record_favor(self, event: Event):
+        """
+        记录favorite剧集，支持收藏更新通知
+        """
+        # 检查是否启用收藏通知功能
+        if not self._enable_favorite_notify:
+            return
+
+        event_info: WebhookEventInfo = event.event_data
+        # 只处理剧集喜爱事件
+        if event_info.event != "item.rate" or event_info.item_type != "TV":
+            return
+        if event_info.channel != "emby":
+            logger.info("目前只支持Emby服务端")
+            return
+        title = event_info.item_name
+        tmdb_id = event_info.tmdb_id
+        if _SEASON_PATTERN.search(title):
+            logger.info("只处理喜爱整季，单集喜爱不处理")
+            return
+        try:
+            # 存储历史记录
+            favor: Dict = self._get_favor()
+            favored = favor.get(tmdb_id)
+            if favored:
+                # 取消收藏直接使用已保存的信息，无需重新识别媒体
+                with self._favor_lock:
+                    favor.pop(tmdb_id, None)
+                title_year = f"{favored.get('title')} ({favored.get('year')})" \
+                    if favored.get('year') else favored.get('title')
+                logger.info(f"{title_year} 取消更新通知")
+                self._post_async(self.chain.post_message, Notification(
+                    mtype=NotificationType.Plugin,
+                    title=f"{title_year} 取消更新通知", text=None, image=favored.get('poster')))
+            else:
+                mediainfo: MediaInfo = self._recognize_tv(title, tmdb_id)
+                with self._favor_lock:
+                    favor[tmdb_id] = {
+                        "title": title,
+                        "type": mediainfo.type.value,
+                        "year": mediainfo.year,
+                        "poster": mediainfo.get_poster_image(),
+                        "overview": mediainfo.overview,
+                        "tmdbid": mediainfo.tmdb_id,
+                        "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                     }
-                ]
-            }
-        ], {
-            'enable': self._enable,
-            'cron': self._cron,
-            'onlyonce': self._onlyonce,
-            'cleanlink': self._cleanlink,
-            'monitor_upload': self._monitor_upload,
-            'notify_upload': self._notify_upload,
-            'upload_retry_count': self._upload_retry_count,
-            'cd2_confs': self._cd2_confs,
-            'cloud_media_sync': self._cloud_media_sync,
-            'monitor_interval': self._monitor_interval,
-            'clean_interval': self._clean_interval,
-            'enable_cookie_check': self._enable_cookie_check,
-            'cookie_check_interval': self._cookie_check_interval,
-            'black_dirs': self._black_dirs,
-            'upload_timeout': self._upload_timeout,
-            'delete_source_after_upload': self._delete_source_after_upload,
-            'enable_favorite_notify': self._enable_favorite_notify,
-            'softlink_prefix_path': self._softlink_prefix_path,
-            'cd_mount_prefix_path': self._cd_mount_prefix_path,
-            # 企业级配置项
-            'enable_enterprise_logging': getattr(self, '_enable_enterprise_logging', True),
-            'enable_distributed_lock': getattr(self, '_enable_distributed_lock', True),
-            'enable_health_check': getattr(self, '_enable_health_check', True),
-            'enable_quota_management': getattr(self, '_enable_quota_management', True),
-            'enable_api_handler': getattr(self, '_enable_api_handler', True),
-            'enable_webhook_manager': getattr(self, '_enable_webhook_manager', True)
-        }
+                logger.info(f"{mediainfo.title_year} 加入更新通知")
+                self._post_async(self.chain.post_message, Notification(
+                    mtype=NotificationType.Plugin,
+                    title=f"{mediainfo.title_year} 加入更新通知", text=None, image=mediainfo.get_message_image()))
+            self._schedule_favor_flush()
+        except Exception as e:
+            logger.error(str(e))
+
+    def _get_favor(self) -> Dict:
+        """获取收藏剧集，首次访问时从插件数据加载"""
+        if self._favor is None:
+            with self._favor_lock:
+                if self._favor is None:
+                    self._favor = self.get_data('favor') or {}
+        return self._favor
+
+    def _schedule_favor_flush(self):
+        """标记收藏数据已变更，5秒内的多次变更合并为一次写入"""
+        with self._favor_lock:
+            self._favor_dirty = True
+            if self._favor_flush_timer is None:
+                self._favor_flush_timer = threading.Timer(5, self._flush_favor)
+                self._favor_flush_timer.daemon = True
+                self._favor_flush_timer.start()
+
+    def _flush_favor(self):
+        """将变更的收藏数据写入插件数据"""
+        with self._favor_lock:
+            if self._favor_flush_timer:
+                self._favor_flush_timer.cancel()
+                self._favor_flush_timer = None
+            if not self._favor_dirty or self._favor is None:
+                return
+            favor = dict(self._favor)
+            self._favor_dirty = False
+        self.save_data('favor', favor)
+
+    def _recognize_tv(self, title: str, tmdb_id) -> Optional[MediaInfo]:
+        """识别剧集媒体信息，相同tmdb_id在缓存有效期内不再重复请求TMDB"""
+        now = time.monotonic()
+        cached = self._media_cache.get(tmdb_id)
+        if cached and now - cached[0] < self._media_cache_ttl:
+            self._media_cache.move_to_end(tmdb_id)
+            return cached[1]
+
+        mediainfo = self.chain.recognize_media(meta=MetaInfo(title), tmdbid=tmdb_id, mtype=MediaType.TV)
+        if mediainfo:
+            self._media_cache[tmdb_id] = (now, mediainfo)
+            self._media_cache.move_to_end(tmdb_id)
+            if len(self._media_cache) > self._media_cache_size:
+                self._media_cache.popitem(last=False)
+        return mediainfo
+
+    def get_state(self) -> bool:
+        return self._enable
+
+    @staticmethod
+    def get_command() -> List[Dict[str, Any]]:
+        pass
+
+    def get_form(self) -> Tuple[List[dict], Dict[str, Any]]:
+        """
+        拼装插件配置页面，需要返回两块数据：1、页面配置；2、数据结构
+        """
+        return _FORM_SCHEMA, {key: getattr(self, attr, default) for key, attr, default in _FORM_DEFAULT_ATTRS}
 
     def get_api(self) -> List[Dict[str, Any]]:
         return []
@@ -3233,10 +3863,35 @@ class Cd2Upload(_PluginBase):
         退出插件
         """
         try:
-            if self._scheduler:
-                self._scheduler.remove_all_jobs()
-                if self._scheduler.running:
-                    self._scheduler.shutdown()
-                self._scheduler = None
+            self._flush_pending_waiting()
+        except Exception as e:
+            logger.error(f"写入待转移列表失败: {e}")
+        try:
+            self._flush_uploaded_buffer()
+        except Exception as e:
+            logger.error(f"写入上传记录失败: {e}")
+        try:
+            self._flush_favor()
+        except Exception as e:
+            logger.error(f"写入收藏数据失败: {e}")
+        # 先取出并清空引用再关闭，重复调用时直接跳过
+        scheduler, self._scheduler = self._scheduler, None
+        try:
+            # shutdown会丢弃未执行的任务，无需先remove_all_jobs
+            if scheduler and scheduler.running:
+                scheduler.shutdown(wait=False)
+        except Exception as e:
+            logger.debug(f"定时服务已停止：{e}")
+        try:
+            webhook_manager, self._webhook_manager = self._webhook_manager, None
+            if webhook_manager:
+                webhook_manager.stop()
+            if self._upload_executor:
+                self._upload_executor.shutdown(wait=False)
+                self._upload_executor = None
+            self._stop_notify_worker()
+            if self._notify_executor:
+                self._notify_executor.shutdown(wait=False)
+                self._notify_executor = None
         except Exception as e:
             logger.error("退出插件失败：%s" % str(e))